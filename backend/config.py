@@ -68,6 +68,7 @@ class LayoutConfig:
     text_font_size: int = 12
     hour_height: int = 60  # Height of an hour slot in day/week view in pixels
     drag_snap_minutes: int = 5  # Snap interval when dragging events (minutes)
+    month_max_events: int = 3  # Events shown per month view cell before "+N more" (0 = no limit)
 
 
 @dataclass
@@ -170,6 +171,7 @@ class LabelsConfig:
     # Miscellaneous Labels
     allday_label: str = "All day"
     no_events: str = "No events"
+    more_events: str = "+{} more"
     location_icon: str = "📍"
     subscription_icon: str = "📡"
     readonly_notice: str = "🔒 This event is read-only (from a subscription)"
@@ -356,7 +358,8 @@ class Config:
             text_font=layout_data.get('text_font', 'Sans'),
             text_font_size=layout_data.get('text_font_size', 12),
             hour_height=layout_data.get('hour_height', 60),
-            drag_snap_minutes=layout_data.get('drag_snap_minutes', 5)
+            drag_snap_minutes=layout_data.get('drag_snap_minutes', 5),
+            month_max_events=layout_data.get('month_max_events', 3)
         )
         
         # Parse Bindings section
@@ -460,6 +463,7 @@ class Config:
             end_until_date=labels_data.get('end_until_date', LabelsConfig.end_until_date),
             allday_label=labels_data.get('allday_label', LabelsConfig.allday_label),
             no_events=labels_data.get('no_events', LabelsConfig.no_events),
+            more_events=labels_data.get('more_events', LabelsConfig.more_events),
             location_icon=labels_data.get('location_icon', LabelsConfig.location_icon),
             subscription_icon=labels_data.get('subscription_icon', LabelsConfig.subscription_icon),
             readonly_notice=labels_data.get('readonly_notice', LabelsConfig.readonly_notice),
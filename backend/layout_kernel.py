@@ -0,0 +1,57 @@
+"""
+Layout kernel for Kubux Calendar.
+
+Side-by-side placement of overlapping events in day columns, computed on
+plain start/end hour arrays so it stays independent of the GUI objects.
+"""
+
+
+def assign_columns(starts: list[float], ends: list[float]) -> tuple[list[int], list[int]]:
+    """
+    Place intervals (sorted by start) in columns so that overlapping ones sit side by side.
+
+    A group of transitively overlapping intervals ends when the next interval starts
+    at or after the group's latest end. Within a group each interval goes to the first
+    column that is free at its start.
+
+    Args:
+        starts: Interval start hours, in ascending order.
+        ends: Interval end hours (each greater than its start).
+
+    Returns:
+        (cols, totals): the column of each interval and the column count of its group.
+    """
+    n = len(starts)
+    cols = [0] * n
+    totals = [0] * n
+    column_ends: list[float] = []  # end hour of the last interval in each column of the group
+    group_first = 0
+    group_end = float('-inf')
+
+    for i in range(n):
+        start = starts[i]
+        end = ends[i]
+        if start >= group_end:
+            # Close the previous group
+            for j in range(group_first, i):
+                totals[j] = len(column_ends)
+            column_ends = []
+            group_first = i
+
+        # Find first column where this interval fits, else open a new one
+        for col_idx, col_end in enumerate(column_ends):
+            if start >= col_end:
+                column_ends[col_idx] = end
+                cols[i] = col_idx
+                break
+        else:
+            cols[i] = len(column_ends)
+            column_ends.append(end)
+
+        if end > group_end:
+            group_end = end
+
+    for j in range(group_first, n):
+        totals[j] = len(column_ends)
+
+    return cols, totals
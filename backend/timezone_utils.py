@@ -13,11 +13,15 @@ import pytz
 # Default timezone - can be overridden by config
 _local_timezone_name: str = "Europe/Amsterdam"
 
+# Resolved named timezone, cached until the next set_timezone() call
+_local_timezone = None
+
 
 def set_timezone(timezone_name: str):
     """Set the local timezone for the application."""
-    global _local_timezone_name
+    global _local_timezone_name, _local_timezone
     _local_timezone_name = timezone_name
+    _local_timezone = None
 
 
 def get_local_timezone():
@@ -27,14 +31,20 @@ def get_local_timezone():
     Returns:
         pytz timezone object for the configured local timezone.
     """
+    global _local_timezone
+    if _local_timezone is not None:
+        return _local_timezone
     try:
-        return pytz.timezone(_local_timezone_name)
+        _local_timezone = pytz.timezone(_local_timezone_name)
+        return _local_timezone
     except pytz.UnknownTimeZoneError:
         # Fallback: try system timezone name
         try:
-            return pytz.timezone(_time.tzname[0])
+            _local_timezone = pytz.timezone(_time.tzname[0])
+            return _local_timezone
         except:
             # Last resort: calculate offset and use fixed offset timezone
+            # (not cached - the offset changes with DST)
             is_dst = _time.localtime().tm_isdst
             if is_dst:
                 offset_seconds = -_time.altzone
@@ -2,22 +2,29 @@
 Calendar Widget with Day, Week, and Month views.
 """
 
+from bisect import bisect_left, bisect_right
+import calendar
 from datetime import datetime, timedelta, date, time as dt_time
+from functools import lru_cache
 from typing import Optional
 from enum import Enum
+import sys
+import traceback
+import weakref
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel,
-    QScrollArea, QFrame, QSizePolicy, QStackedWidget
+    QScrollArea, QFrame, QSizePolicy, QStackedWidget, QApplication, QStyle, QToolTip
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QFont, QFontMetrics, QMouseEvent
+from PySide6.QtCore import Qt, Signal, QTimer, QDateTime, QObject, QRunnable, QThreadPool, QSignalBlocker, QPoint, QPointF, QLine
+from PySide6.QtGui import QFont, QFontMetrics, QMouseEvent, QPainter, QColor, QBrush, QPolygonF
 
 from backend.event_wrapper import CalEvent as EventData
 from backend.config import LayoutConfig, LocalizationConfig, ColorsConfig, LabelsConfig
 from .event_widget import (
     EventWidget, DraggableEventWidget, DragMode,
-    set_event_layout_config, set_event_colors_config
+    set_event_layout_config, set_event_colors_config,
+    get_contrasting_text_color, lighten_color
 )
 
 # Module-level configs (set by MainWindow at startup)
@@ -29,12 +36,27 @@ _labels_config: LabelsConfig = LabelsConfig()
 # Module-level hour height (updated when layout config is set)
 HOUR_HEIGHT = 60  # Default value
 
+# Shared date steps for navigation and day iteration
+_ONE_DAY = timedelta(days=1)
+_ONE_WEEK = timedelta(weeks=1)
+# Day offsets from the first day of a week (first 7) or month grid (all 42)
+_DAY_OFFSETS = tuple(timedelta(days=i) for i in range(42))
+
+# Font-metric based sizes, measured on first use (reset when layout config changes)
+_cached_line_height: Optional[int] = None
+_cached_time_col_width: Optional[int] = None
+
+# Style scrollbar extent, queried once (the application style does not change)
+_scrollbar_width: Optional[int] = None
+
 
 def set_layout_config(config: LayoutConfig):
     """Set the layout configuration for this module and event widget."""
-    global _layout_config, HOUR_HEIGHT
+    global _layout_config, HOUR_HEIGHT, _cached_line_height, _cached_time_col_width
     _layout_config = config
     HOUR_HEIGHT = config.hour_height
+    _cached_line_height = None
+    _cached_time_col_width = None
     # Also set for event widgets
     set_event_layout_config(config)
 
@@ -88,13 +110,25 @@ def get_interface_font() -> tuple[str, int]:
     return (_layout_config.interface_font, _layout_config.interface_font_size)
 
 
+@lru_cache(maxsize=1)
+def _today_for_minute(minute: int) -> date:
+    """Get today's date, memoized per wall-clock minute (the argument is the cache key)."""
+    return date.today()
+
+
 # Import timezone utilities from shared module
-from backend.timezone_utils import to_local_datetime, to_local_hour
+from backend.timezone_utils import to_local_datetime
+from backend.layout_kernel import assign_columns
 
 
 from dataclasses import dataclass
 
 
+def _minute_of_day(hour: float) -> int:
+    """Whole minute of the day for a fractional hour (seconds dropped)."""
+    return int(hour) * 60 + int((hour % 1) * 60)
+
+
 @dataclass
 class EventPortion:
     """
@@ -119,7 +153,14 @@ class EventPortion:
         """
         local_start = to_local_datetime(event.start)
         local_end = to_local_datetime(event.end)
-        
+        return EventPortion.create_for_local_day(event, day, local_start, local_end)
+    
+    @staticmethod
+    def create_for_local_day(event: EventData, day: date,
+                             local_start: datetime, local_end: datetime) -> Optional['EventPortion']:
+        """
+        Like create_for_day(), but with the event's local start/end already converted.
+        """
         # Check if event appears on this day
         if local_end.date() < day or local_start.date() > day:
             return None  # Event doesn't span this day
@@ -143,19 +184,8 @@ class EventPortion:
         
         When a portion is moved, we need to translate that to the underlying event's new times.
         """
-        # Calculate the delta between old and new portion start
-        old_portion_start = datetime.combine(
-            self.display_date,
-            dt_time(hour=int(self.visible_start_hour),
-                   minute=int((self.visible_start_hour % 1) * 60))
-        )
-        new_portion_start = datetime.combine(
-            self.display_date,
-            dt_time(hour=int(new_visible_start_hour),
-                   minute=int((new_visible_start_hour % 1) * 60))
-        )
-        
-        delta = new_portion_start - old_portion_start
+        # Calculate the delta between old and new portion start, in whole minutes
+        delta = timedelta(minutes=_minute_of_day(new_visible_start_hour) - _minute_of_day(self.visible_start_hour))
         
         # Apply the same delta to the actual event times
         old_event_start = to_local_datetime(self.event.start)
@@ -167,6 +197,140 @@ class EventPortion:
         return (new_event_start, new_event_end)
 
 
+class EventIndex:
+    """
+    Events pre-bucketed by local display date.
+    
+    Timezone conversion, all-day end adjustment and multi-day expansion are
+    done once here (off the GUI thread, see EventIndexBuilder), so views only
+    do dictionary lookups when their date changes.
+    """
+    
+    def __init__(self, events: list[EventData],
+                 times: Optional[list[tuple[datetime, datetime, bool]]] = None):
+        """
+        Args:
+            events: The events to index.
+            times: (start, end, all_day) of each event, see event_times(). Read from
+                   the events when omitted - pass them in for a build off the GUI thread.
+        """
+        if times is None:
+            times = event_times(events)
+        self.events = events
+        self._all_day_by_date: dict[date, list[EventData]] = {}
+        self._portions_by_date: dict[date, list[EventPortion]] = {}
+        self._month_events_by_date: dict[date, list[EventData]] = {}
+        
+        local_starts: list[datetime] = []  # naive local start times, for ordering
+        for event, (start, end, all_day) in zip(events, times):
+            if all_day:
+                # All-day events are stored at UTC midnight of their (floating) dates,
+                # so the dates are read directly - no timezone conversion needed
+                start_date = start.date()
+                end_date = end.date()
+                local_starts.append(datetime.combine(start_date, dt_time.min))
+                # All-day events typically have end at midnight of next day, so subtract 1 day for display
+                if end_date > start_date:
+                    end_date = end_date - _ONE_DAY
+                # Multi-day all-day events appear on each day they span
+                day = start_date
+                while day <= end_date:
+                    self._all_day_by_date.setdefault(day, []).append(event)
+                    self._month_events_by_date.setdefault(day, []).append(event)
+                    day += _ONE_DAY
+            else:
+                local_start = to_local_datetime(start)
+                local_end = to_local_datetime(end)
+                local_starts.append(local_start.replace(tzinfo=None))
+                start_date = local_start.date()
+                end_date = local_end.date()
+                # Timed event - month view shows it on its start day only,
+                # day/week views get one portion per day it spans
+                self._month_events_by_date.setdefault(start_date, []).append(event)
+                day = start_date
+                while day <= end_date:
+                    portion = EventPortion.create_for_local_day(event, day, local_start, local_end)
+                    self._portions_by_date.setdefault(day, []).append(portion)
+                    day += _ONE_DAY
+        
+        # Chronological order for the list view, with the naive local start
+        # times kept as a parallel array for bisect lookups
+        order = sorted(range(len(events)), key=local_starts.__getitem__)
+        self.sorted_events: list[EventData] = [events[i] for i in order]
+        self.sorted_local_starts: list[datetime] = [local_starts[i] for i in order]
+    
+    def first_index_at_or_after(self, local_dt: datetime) -> int:
+        """Position in sorted_events of the first event starting at or after local_dt."""
+        return bisect_left(self.sorted_local_starts, local_dt.replace(tzinfo=None))
+    
+    def all_day_events_on(self, day: date) -> list[EventData]:
+        """All-day events displayed on the given day."""
+        return self._all_day_by_date.get(day, [])
+    
+    def portions_on(self, day: date) -> list[EventPortion]:
+        """Portions of timed events visible on the given day."""
+        return self._portions_by_date.get(day, [])
+    
+    def month_events_on(self, day: date) -> list[EventData]:
+        """Events for a month cell: all-day events spanning the day, timed events starting on it."""
+        return self._month_events_by_date.get(day, [])
+
+
+def _event_render_key(e: EventData) -> tuple:
+    """Everything an event widget reads of an event: set_event(), the tooltip and the indicators."""
+    # As in EventWidget._apply_style: pending_operation is on the event, or for an instance on its master
+    pending_op = getattr(e, 'pending_operation', None)
+    if pending_op is None:
+        pending_op = getattr(e.event, 'pending_operation', None)
+    source = e.source
+    return (id(e.event), e.start, e.end, e.summary, e.location, e.description, e.all_day,
+            e.calendar_color, e.calendar_name, e.read_only, e.is_recurring, e.sync_status, pending_op,
+            getattr(source, 'last_sync_time', None), getattr(source, 'is_outdated', False))
+
+
+def _events_fingerprint(events: list[EventData]) -> tuple:
+    """Everything the views display for an event list, for cheap change detection."""
+    return tuple(_event_render_key(e) for e in events)
+
+
+def event_times(events: list[EventData]) -> list[tuple[datetime, datetime, bool]]:
+    """(start, end, all_day) of each event - the event properties EventIndex reads."""
+    return [(e.start, e.end, is_all_day_event(e)) for e in events]
+
+
+class _EventIndexSignals(QObject):
+    """Signals for EventIndexBuilder (QRunnable is not a QObject)."""
+    
+    finished = Signal(int, object)  # epoch, EventIndex (None if building it failed)
+
+
+class EventIndexBuilder(QRunnable):
+    """
+    Builds an EventIndex on a QThreadPool worker thread.
+    
+    The result is delivered via signals.finished, which Qt queues to the
+    receiver's (GUI) thread. The epoch lets the receiver drop stale results.
+    The event times are read on the GUI thread (see event_times()), so the
+    worker does not touch the icalendar data the GUI may be changing.
+    """
+    
+    def __init__(self, events: list[EventData], times: list[tuple[datetime, datetime, bool]], epoch: int):
+        super().__init__()
+        self._events = events
+        self._times = times
+        self._epoch = epoch
+        self.signals = _EventIndexSignals()
+    
+    def run(self):
+        try:
+            index = EventIndex(self._events, self._times)
+        except Exception:
+            print(f"DEBUG EventIndexBuilder: building index for epoch {self._epoch} failed", file=sys.stderr)
+            traceback.print_exc(file=sys.stderr)
+            index = None  # Still report, so the receiver stops waiting
+        self.signals.finished.emit(self._epoch, index)
+
+
 class ViewType(Enum):
     DAY = "day"
     WEEK = "week"
@@ -174,11 +338,23 @@ class ViewType(Enum):
     LIST = "list"
 
 
+def _label_font_metrics() -> QFontMetrics:
+    """Metrics of the font a new QLabel gets, without constructing one."""
+    return QFontMetrics(QApplication.font("QLabel"))
+
+
+@lru_cache(maxsize=8)
+def _text_advance(family: str, point_size: int, text: str) -> int:
+    """Width of text in the given font, measured once per font and text."""
+    return QFontMetrics(QFont(family, point_size)).horizontalAdvance(text)
+
+
 def _get_single_line_event_height() -> int:
     """Calculate height for a single-line event based on font metrics."""
-    sample_label = QLabel("Sample")
-    fm = QFontMetrics(sample_label.font())
-    return fm.height() + 8  # font height + padding
+    global _cached_line_height
+    if _cached_line_height is None:
+        _cached_line_height = _label_font_metrics().height() + 8  # font height + padding
+    return _cached_line_height
 
 
 def is_all_day_event(event: 'EventData') -> bool:
@@ -186,12 +362,35 @@ def is_all_day_event(event: 'EventData') -> bool:
     return event.all_day
 
 
+def _day_grid_stylesheet() -> str:
+    """
+    Stylesheet for day columns and all-day cells.
+    
+    Set once on the containing view, so the class selectors replace a
+    stylesheet parse per column/cell.
+    """
+    colors = get_colors_config()
+    return (
+        f"DayColumnWidget {{ background-color: {colors.day_column_background}; border: 1px solid {colors.cell_border}; }}\n"
+        f"AllDayEventCell {{ background-color: {colors.allday_cell_background}; border-bottom: 1px solid {colors.cell_border}; }}"
+    )
+
+
 def _get_time_column_width() -> int:
     """Calculate time column width based on actual font metrics."""
-    sample_label = QLabel("00:00")
-    metrics = QFontMetrics(sample_label.font())
-    # Measure the text plus padding for right margin
-    return metrics.horizontalAdvance("00:00") + 15
+    global _cached_time_col_width
+    if _cached_time_col_width is None:
+        # Measure the text plus padding for right margin
+        _cached_time_col_width = _label_font_metrics().horizontalAdvance("00:00") + 15
+    return _cached_time_col_width
+
+
+def _get_scrollbar_width() -> int:
+    """Get the vertical scrollbar width of the application style."""
+    global _scrollbar_width
+    if _scrollbar_width is None:
+        _scrollbar_width = QApplication.style().pixelMetric(QStyle.PM_ScrollBarExtent)
+    return _scrollbar_width
 
 
 class AllDayEventCell(QWidget):
@@ -204,33 +403,42 @@ class AllDayEventCell(QWidget):
         super().__init__(parent)
         self._events: list[EventData] = []
         self._event_widgets: list[EventWidget] = []
-        self._setup_ui()
+        self._widget_pool: list[EventWidget] = []  # Hidden widgets for reuse by add_event()
+        # Event widgets are stacked by _place_widget() - all have the same height, so no layout is needed
+        # Styled by the class selector in _day_grid_stylesheet(), set on the view
     
-    def _setup_ui(self):
-        self._layout = QVBoxLayout(self)
-        self._layout.setContentsMargins(2, 2, 2, 2)
-        self._layout.setSpacing(2)
-        colors = get_colors_config()
-        self.setStyleSheet(f"background-color: {colors.allday_cell_background}; border-bottom: 1px solid {colors.cell_border};")
+    def _place_widget(self, index: int, widget: EventWidget):
+        """Put widget in the index-th row: 2px margins around the stack, 2px between rows."""
+        event_height = _get_single_line_event_height() - 4
+        widget.setGeometry(2, 2 + index * (event_height + 2), self.width() - 4, event_height)
     
     def add_event(self, event: EventData):
         self._events.append(event)
-        widget = EventWidget(event, compact=True, show_time=False, show_location=False, parent=self)
-        event_height = _get_single_line_event_height()
-        widget.setFixedHeight(event_height - 4)
-        widget.clicked.connect(self.event_clicked.emit)
-        widget.double_clicked.connect(self.event_double_clicked.emit)
-        self._layout.addWidget(widget)
-        self._layout.setAlignment(Qt.AlignTop)
+        if self._widget_pool:
+            widget = self._widget_pool.pop()
+            widget.set_event(event)
+        else:
+            widget = EventWidget(event, compact=True, show_time=False, show_location=False, parent=self)
+            widget.setFixedHeight(_get_single_line_event_height() - 4)
+            widget.clicked.connect(self.event_clicked)
+            widget.double_clicked.connect(self.event_double_clicked)
+        self._place_widget(len(self._event_widgets), widget)
+        widget.show()
         self._event_widgets.append(widget)
     
     def clear_events(self):
+        # Keep the widgets for add_event() instead of deleting them
         for widget in self._event_widgets:
             widget.hide()  # Hide immediately to prevent visual duplication
-            widget.deleteLater()
+            self._widget_pool.append(widget)
         self._event_widgets.clear()
         self._events.clear()
     
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        for index, widget in enumerate(self._event_widgets):
+            self._place_widget(index, widget)
+    
     def event_count(self) -> int:
         return len(self._events)
 
@@ -245,6 +453,7 @@ class AllDayEventsRow(QWidget):
         super().__init__(parent)
         self._num_days = num_days
         self._cells: list[AllDayEventCell] = []
+        self._cell_counts: list[int] = [0] * num_days  # Event count per cell, kept in step with the cells
         self._setup_ui()
     
     def _setup_ui(self):
@@ -254,25 +463,46 @@ class AllDayEventsRow(QWidget):
         
         for _ in range(self._num_days):
             cell = AllDayEventCell()
-            cell.event_clicked.connect(self.event_clicked.emit)
-            cell.event_double_clicked.connect(self.event_double_clicked.emit)
+            cell.event_clicked.connect(self.event_clicked)
+            cell.event_double_clicked.connect(self.event_double_clicked)
             layout.addWidget(cell, 1)
             self._cells.append(cell)
     
     def set_events_for_day(self, day_index: int, events: list[EventData]):
         """Set all-day events for a specific day column."""
         if 0 <= day_index < len(self._cells):
-            self._cells[day_index].clear_events()
-            for event in events:
-                self._cells[day_index].add_event(event)
+            if not events and not self._cell_counts[day_index]:
+                return  # Empty before and after - the common case of a day without all-day events
+            cell = self._cells[day_index]
+            cell.setUpdatesEnabled(False)
+            try:
+                cell.clear_events()
+                for event in events:
+                    cell.add_event(event)
+            finally:
+                cell.setUpdatesEnabled(True)
+            self._cell_counts[day_index] = len(events)
+    
+    def set_events_bulk(self, events_by_day: list[list[EventData]]):
+        """Set the all-day events of every day and fit the height, repainting once."""
+        if self.isHidden() and not any(self._cell_counts) and not any(events_by_day):
+            return  # Empty before and after, and already hidden - the usual week without all-day events
+        self.setUpdatesEnabled(False)
+        try:
+            for day_index, events in enumerate(events_by_day):
+                self.set_events_for_day(day_index, events)
+            self.update_height()
+        finally:
+            self.setUpdatesEnabled(True)
     
     def clear_all(self):
         for cell in self._cells:
             cell.clear_events()
+        self._cell_counts = [0] * self._num_days
     
     def get_max_events(self) -> int:
         """Get the maximum number of all-day events across all days."""
-        return max((cell.event_count() for cell in self._cells), default=0)
+        return max(self._cell_counts, default=0)
     
     def update_height(self):
         """Update height based on maximum events across all days."""
@@ -300,13 +530,22 @@ class DayColumnWidget(QWidget):
     event_double_clicked = Signal(EventData)
     event_time_changed = Signal(EventData, datetime, datetime)  # event, new_start, new_end
     
+    # One minute timer for the time indicators of all columns, created by the first column
+    _time_timer: Optional[QTimer] = None
+    # All live columns, searched for the drop target of a drag
+    _instances: "weakref.WeakSet[DayColumnWidget]" = weakref.WeakSet()
+    
     def __init__(self, for_date: date, parent=None):
         super().__init__(parent)
+        DayColumnWidget._instances.add(self)
         self._date = for_date
         self._portions: list[EventPortion] = []
         self._event_widgets: list[DraggableEventWidget] = []
         self._event_layout: list[tuple[EventPortion, int, int]] = []  # (portion, column, total_columns)
-        self._widget_to_portion: dict[DraggableEventWidget, EventPortion] = {}  # Map widgets to portions
+        self._layout_spans: list[tuple[int, int]] = []  # (y, height) in pixels per _event_layout entry
+        self._last_positioned_width: int = -1  # Widgets only depend on the width (height is fixed)
+        # Hidden widgets kept for reuse by the next layout, per widget class
+        self._widget_pool: dict[type, list[EventWidget]] = {EventWidget: [], DraggableEventWidget: []}
         
         # Drag state
         self._dragging_event: Optional[EventData] = None
@@ -316,6 +555,7 @@ class DayColumnWidget(QWidget):
         self._drag_original_start: Optional[datetime] = None
         self._drag_original_end: Optional[datetime] = None
         self._drag_grab_offset_y: int = 0  # Offset from event top to grab point (pixels)
+        self._drag_tooltip_text: str = ""  # Last time range shown while dragging
         
         self._setup_ui()
         self._setup_time_indicator()
@@ -328,15 +568,12 @@ class DayColumnWidget(QWidget):
         # Fixed height for 24 hours
         self.setMinimumHeight(24 * HOUR_HEIGHT)
         self.setMaximumHeight(24 * HOUR_HEIGHT)
-        self.setStyleSheet(f"background-color: {colors.day_column_background}; border: 1px solid {colors.cell_border};")
+        # Styled by the class selector in _day_grid_stylesheet(), set on the view
         self.setCursor(Qt.PointingHandCursor)
         
-        # Draw hour lines
-        for hour in range(1, 24):
-            line = QFrame(self)
-            line.setFrameStyle(QFrame.HLine | QFrame.Plain)
-            line.setStyleSheet(f"background-color: {colors.hour_line};")
-            line.setGeometry(0, hour * HOUR_HEIGHT, 2000, 1)
+        # Hour lines are drawn in paintEvent()
+        self._hour_line_color = QColor(colors.hour_line)
+        self._hour_lines: list[QLine] = []  # The 23 hour lines at the current width, see resizeEvent()
     
     def _setup_time_indicator(self):
         """Set up the current time indicator line."""
@@ -344,30 +581,41 @@ class DayColumnWidget(QWidget):
         self._time_indicator = QFrame(self)
         self._time_indicator.setFrameStyle(QFrame.HLine | QFrame.Plain)
         colors = get_colors_config()
-        self._time_indicator.setStyleSheet(f"background-color: {colors.current_time_line};")
+        # Border as previously inherited from the column's own (selector-less) stylesheet
+        self._time_indicator.setStyleSheet(f"background-color: {colors.current_time_line}; border: 1px solid {colors.cell_border};")
         self._time_indicator.setFixedHeight(3)
         self._time_indicator.raise_()  # Ensure it's on top of other elements
         
-        # Create timer to update every minute
-        self._time_timer = QTimer(self)
-        self._time_timer.timeout.connect(self._update_time_indicator)
-        self._time_timer.start(60000)  # Update every 60 seconds
+        # Update every minute from the timer shared by all columns
+        if DayColumnWidget._time_timer is None:
+            DayColumnWidget._time_timer = QTimer()
+            DayColumnWidget._time_timer.timeout.connect(DayColumnWidget._update_time_indicators)
+            DayColumnWidget._time_timer.start(60000)
         
         # Initial update
         self._update_time_indicator()
     
-    def _update_time_indicator(self):
+    @staticmethod
+    def _update_time_indicators():
+        """Minute tick: re-check every live column, so the indicator moves to the new day at midnight."""
+        today = date.today()
+        for column in DayColumnWidget._instances:
+            column._update_time_indicator(today)
+    
+    def _update_time_indicator(self, today: Optional[date] = None):
         """Update the position of the current time indicator."""
-        if self._date != date.today():
-            self._time_indicator.hide()
+        if self._date != (today or date.today()):
+            if not self._time_indicator.isHidden():
+                self._time_indicator.hide()
             return
         
-        # Show and position the indicator
+        # Show and position the indicator (geometry only changes every few minutes or on resize)
         self._time_indicator.show()
         now = datetime.now()
         current_hour = now.hour + now.minute / 60.0
         y_pos = int(current_hour * HOUR_HEIGHT)
-        self._time_indicator.setGeometry(0, y_pos, self.width(), 2)
+        if self._time_indicator.y() != y_pos or self._time_indicator.width() != self.width():
+            self._time_indicator.setGeometry(0, y_pos, self.width(), 2)
         self._time_indicator.raise_()  # Keep on top
     
     def set_date(self, new_date: date):
@@ -384,120 +632,88 @@ class DayColumnWidget(QWidget):
         self._calculate_layout()
         self._create_event_widgets()
     
-    def _portions_overlap(self, p1: EventPortion, p2: EventPortion) -> bool:
-        """Check if two event portions overlap in visible hours on this day."""
-        s1 = p1.visible_start_hour
-        e1 = p1.visible_end_hour
-        s2 = p2.visible_start_hour
-        e2 = p2.visible_end_hour
-        # Ensure minimum duration
-        if e1 <= s1:
-            e1 = s1 + 0.5
-        if e2 <= s2:
-            e2 = s2 + 0.5
-        return s1 < e2 and s2 < e1
+    def set_portions(self, portions: list[EventPortion]):
+        """Replace all portions and lay them out in one pass."""
+        self._portions = list(portions)
+        self.finalize_portions()
     
     def _calculate_layout(self):
         """Calculate column positions for overlapping portions."""
+        self._event_layout = []
+        self._layout_spans = []
         if not self._portions:
-            self._event_layout = []
             return
         
         # Sort portions by start hour, then by duration (longer first)
         sorted_portions = sorted(self._portions, key=lambda p: (p.visible_start_hour, -(p.visible_end_hour - p.visible_start_hour)))
         
-        # Assign columns to portions
-        portion_groups: list[list[EventPortion]] = []  # groups of overlapping portions
-        
-        # Build overlap groups
-        for portion in sorted_portions:
-            # Find which existing groups this portion overlaps with
-            overlapping_groups = []
-            for i, group in enumerate(portion_groups):
-                for group_portion in group:
-                    if self._portions_overlap(portion, group_portion):
-                        overlapping_groups.append(i)
-                        break
-            
-            if not overlapping_groups:
-                # Start a new group
-                portion_groups.append([portion])
-            elif len(overlapping_groups) == 1:
-                # Add to existing group
-                portion_groups[overlapping_groups[0]].append(portion)
-            else:
-                # Merge groups
-                merged = []
-                for i in sorted(overlapping_groups, reverse=True):
-                    merged.extend(portion_groups.pop(i))
-                merged.append(portion)
-                portion_groups.append(merged)
-        
-        # Assign column numbers within each group
-        self._event_layout = []
-        for group in portion_groups:
-            # Sort group by start time
-            group.sort(key=lambda p: p.visible_start_hour)
-            
-            # Assign columns greedily
-            columns: list[float] = []  # end hour of portion in each column
-            portion_col_map: dict[str, int] = {}  # event.uid -> column
-            
-            for portion in group:
-                start = portion.visible_start_hour
-                end = portion.visible_end_hour
-                if end <= start:
-                    end = start + 0.5
-                
-                # Find first column where this portion fits
-                assigned = False
-                for col_idx, col_end in enumerate(columns):
-                    if start >= col_end:
-                        columns[col_idx] = end
-                        portion_col_map[portion.event.uid] = col_idx
-                        assigned = True
-                        break
-                
-                if not assigned:
-                    # Need a new column
-                    portion_col_map[portion.event.uid] = len(columns)
-                    columns.append(end)
-            
-            total_cols = len(columns)
-            for portion in group:
-                col = portion_col_map[portion.event.uid]
-                self._event_layout.append((portion, col, total_cols))
+        # Visible hours of each sorted portion, computed once (minimum duration 0.5h)
+        starts = [p.visible_start_hour for p in sorted_portions]
+        ends = [p.visible_end_hour if p.visible_end_hour > p.visible_start_hour else p.visible_start_hour + 0.5
+                for p in sorted_portions]
+        
+        # Columns for side-by-side placement of overlapping portions
+        cols, totals = assign_columns(starts, ends)
+        for i, portion in enumerate(sorted_portions):
+            self._event_layout.append((portion, cols[i], totals[i]))
+            # Vertical placement, clamped to the column - a resize only changes x and width
+            start_hour = max(0, min(24, starts[i]))
+            end_hour = max(0, min(24, portion.visible_end_hour))
+            if end_hour <= start_hour:
+                end_hour = start_hour + 0.5
+            y = int(start_hour * HOUR_HEIGHT)
+            height = max(int((end_hour - start_hour) * HOUR_HEIGHT), 20)
+            self._layout_spans.append((y, height))
     
-    def _create_event_widgets(self):
-        """Create and position event widgets based on calculated layout."""
+    def _release_event_widgets(self):
+        """Hide the current event widgets and return them to the pool."""
         for widget in self._event_widgets:
             widget.hide()  # Hide immediately to prevent visual duplication
-            widget.deleteLater()
+            self._widget_pool[type(widget)].append(widget)
         self._event_widgets.clear()
-        self._widget_to_portion.clear()
-        
-        for portion, col, total_cols in self._event_layout:
-            # Use DraggableEventWidget for editable events, EventWidget for read-only
-            # Get the actual EventData from the portion
-            event = portion.event
-            if event.read_only:
-                widget = EventWidget(event, compact=True, parent=self)
-            else:
-                widget = DraggableEventWidget(event, compact=True, parent=self)
-                widget.drag_started.connect(self._on_drag_started)
-                widget.drag_moved.connect(self._on_drag_moved)
-                widget.drag_finished.connect(self._on_drag_finished)
-                # Map widget to portion for drag operations
-                self._widget_to_portion[widget] = portion
-            widget.clicked.connect(self.event_clicked.emit)
-            widget.double_clicked.connect(self.event_double_clicked.emit)
-            self._event_widgets.append(widget)
-            widget.show()
-        
-        self._position_event_widgets()
-        
-        # Ensure time indicator stays on top of event widgets
-        self._time_indicator.raise_()
+    
+    def _acquire_event_widget(self, event: EventData) -> EventWidget:
+        """Get a widget showing event - reused from the pool if possible."""
+        # Use DraggableEventWidget for editable events, EventWidget for read-only
+        widget_class = EventWidget if event.read_only else DraggableEventWidget
+        pool = self._widget_pool[widget_class]
+        if pool:
+            widget = pool.pop()
+            widget.set_event(event)
+            return widget
+        
+        widget = widget_class(event, compact=True, parent=self)
+        if widget_class is DraggableEventWidget:
+            widget.drag_started.connect(self._on_drag_started)
+            widget.drag_moved.connect(self._on_drag_moved)
+            widget.drag_finished.connect(self._on_drag_finished)
+        widget.clicked.connect(self.event_clicked)
+        widget.double_clicked.connect(self.event_double_clicked)
+        return widget
+    
+    def _create_event_widgets(self):
+        """Create and position event widgets based on calculated layout."""
+        # Repaint the column once at the end rather than per widget
+        self.setUpdatesEnabled(False)
+        try:
+            self._release_event_widgets()
+            
+            # Widgets are index-aligned with _event_layout
+            for portion, col, total_cols in self._event_layout:
+                # Get the actual EventData from the portion
+                widget = self._acquire_event_widget(portion.event)
+                self._event_widgets.append(widget)
+            
+            self._last_positioned_width = -1
+            self._position_event_widgets()
+            # Show only once placed, so no widget is shown at a stale geometry first
+            for widget in self._event_widgets:
+                widget.show()
+            
+            # Ensure time indicator stays on top of event widgets
+            self._time_indicator.raise_()
+        finally:
+            self.setUpdatesEnabled(True)
     
     def _y_to_time(self, y: int) -> dt_time:
         """Convert Y position to time, snapped to configured interval."""
@@ -530,7 +746,7 @@ class DayColumnWidget(QWidget):
         
         # Find which portion is being dragged
         self._dragging_portion = None
-        for widget, portion in self._widget_to_portion.items():
+        for portion, col, total_cols in self._event_layout:
             if portion.event == event:
                 self._dragging_portion = portion
                 break
@@ -538,6 +754,7 @@ class DayColumnWidget(QWidget):
         # Store the grab offset (distance from event top to where user clicked)
         # This ensures grab-and-release-without-moving keeps event in place
         self._drag_grab_offset_y = y_offset_in_widget
+        self._drag_tooltip_text = ""
     
     def _on_drag_moved(self, event: EventData, mode: DragMode, global_pos):
         """Handle drag move - show time tooltip as visual feedback."""
@@ -584,8 +801,12 @@ class DayColumnWidget(QWidget):
             else:
                 return
             
+            # Times are snapped, so most moves give the same text - only show changes
+            if time_str == self._drag_tooltip_text:
+                return
+            self._drag_tooltip_text = time_str
+            
             # Show tooltip at cursor position
-            from PySide6.QtWidgets import QToolTip
             QToolTip.showText(global_pos, time_str, self)
     
     def _find_target_day_column(self, global_pos) -> tuple[date, int]:
@@ -594,28 +815,15 @@ class DayColumnWidget(QWidget):
         Returns:
             Tuple of (target_date, local_y) where the event should be placed.
         """
-        from PySide6.QtWidgets import QApplication
+        # Test against the on-screen part of the shown columns - cheaper than QApplication.widgetAt()
+        for column in DayColumnWidget._instances:
+            if column.isVisible():
+                local_pos = column.mapFromGlobal(global_pos)
+                if column.visibleRegion().contains(local_pos):
+                    return (column._date, local_pos.y())
         
-        # Default to this widget if we can't find another
-        target_date = self._date
-        local_pos = self.mapFromGlobal(global_pos)
-        local_y = local_pos.y()
-        
-        # Find widget under cursor
-        widget_at_pos = QApplication.widgetAt(global_pos)
-        if widget_at_pos is None:
-            return (target_date, local_y)
-        
-        # Walk up the widget tree to find a DayColumnWidget
-        current = widget_at_pos
-        while current is not None:
-            if isinstance(current, DayColumnWidget):
-                target_date = current._date
-                local_y = current.mapFromGlobal(global_pos).y()
-                break
-            current = current.parentWidget()
-        
-        return (target_date, local_y)
+        # Default to this widget if the position is not over any column
+        return (self._date, self.mapFromGlobal(global_pos).y())
     
     def _on_drag_finished(self, event: EventData, mode: DragMode, global_pos):
         """Handle drag completion - calculate new times and emit signal."""
@@ -697,20 +905,14 @@ class DayColumnWidget(QWidget):
     
     def _position_event_widgets(self):
         """Position all event widgets based on their layout."""
-        available_width = self.width() - 4  # Leave 2px margin on each side
-        
-        for widget, (portion, col, total_cols) in zip(self._event_widgets, self._event_layout):
-            # Use portion's visible hours for this specific day
-            start_hour = portion.visible_start_hour
-            end_hour = portion.visible_end_hour
-            start_hour = max(0, min(24, start_hour))
-            end_hour = max(0, min(24, end_hour))
-            if end_hour <= start_hour:
-                end_hour = start_hour + 0.5
-            
-            y = int(start_hour * HOUR_HEIGHT)
-            height = max(int((end_hour - start_hour) * HOUR_HEIGHT), 20)
-            
+        width = self.width()
+        if width == self._last_positioned_width:
+            return  # Height-only resize - positions are unchanged
+        self._last_positioned_width = width
+        available_width = width - 4  # Leave 2px margin on each side
+        
+        for widget, (portion, col, total_cols), (y, height) in zip(
+                self._event_widgets, self._event_layout, self._layout_spans):
             # Calculate width and x position based on column
             col_width = available_width // total_cols
             x = 2 + col * col_width
@@ -720,15 +922,23 @@ class DayColumnWidget(QWidget):
     
     def clear_portions(self):
         """Clear all portions and widgets."""
-        for widget in self._event_widgets:
-            widget.hide()  # Hide immediately to prevent visual duplication
-            widget.deleteLater()
-        self._event_widgets.clear()
+        self._release_event_widgets()
         self._portions.clear()
         self._event_layout.clear()
+        self._layout_spans.clear()
+    
+    def paintEvent(self, event):
+        """Draw the hour lines directly instead of using one child frame per line."""
+        super().paintEvent(event)
+        painter = QPainter(self)
+        painter.setPen(self._hour_line_color)
+        painter.drawLines(self._hour_lines)
+        painter.end()
     
     def resizeEvent(self, event):
         super().resizeEvent(event)
+        width = self.width()
+        self._hour_lines = [QLine(0, hour * HOUR_HEIGHT, width, hour * HOUR_HEIGHT) for hour in range(1, 24)]
         self._position_event_widgets()
         self._update_time_indicator()  # Update width on resize
     
@@ -749,6 +959,27 @@ class DayColumnWidget(QWidget):
         super().mouseDoubleClickEvent(event)
 
 
+class TimeLabelsWidget(QWidget):
+    """Hour labels (01:00 - 23:00) of the time column, each centered on its hour line."""
+    
+    def __init__(self, width: int, background: Optional[str] = None, parent=None):
+        super().__init__(parent)
+        self.setFixedWidth(width)
+        self.setFixedHeight(24 * HOUR_HEIGHT)
+        self._background = QColor(background) if background else None
+    
+    def paintEvent(self, event):
+        """Draw the labels directly instead of using one QLabel per hour."""
+        painter = QPainter(self)
+        if self._background is not None:
+            painter.fillRect(self.rect(), self._background)
+        width = self.width()
+        for hour in range(1, 24):
+            top = hour * HOUR_HEIGHT - HOUR_HEIGHT // 2
+            painter.drawText(0, top, width, HOUR_HEIGHT, Qt.AlignCenter, f"{hour:02d}:00")
+        painter.end()
+
+
 class DayView(QWidget):
     """Single day view with hourly time slots and all-day events section."""
     
@@ -761,10 +992,13 @@ class DayView(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._date = date.today()
-        self._events: list[EventData] = []
+        self._event_index = EventIndex([])
+        self._shown_key: Optional[tuple] = None  # (date, index) the event widgets were last filled for
         self._setup_ui()
     
     def _setup_ui(self):
+        # One stylesheet for all day columns and all-day cells of this view
+        self.setStyleSheet(_day_grid_stylesheet())
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
@@ -785,8 +1019,8 @@ class DayView(QWidget):
         
         # All-day events row (single day)
         self._all_day_row = AllDayEventsRow(num_days=1)
-        self._all_day_row.event_clicked.connect(self.event_clicked.emit)
-        self._all_day_row.event_double_clicked.connect(self.event_double_clicked.emit)
+        self._all_day_row.event_clicked.connect(self.event_clicked)
+        self._all_day_row.event_double_clicked.connect(self.event_double_clicked)
         self._all_day_row.hide()  # Hidden initially
         all_day_layout.addWidget(self._all_day_row, 1)
         
@@ -799,28 +1033,7 @@ class DayView(QWidget):
         grid_layout.setSpacing(0)
         
         # Time labels column (fixed, outside scroll)
-        self._time_labels = QWidget()
-        self._time_labels.setFixedWidth(time_col_width)
-        self._time_labels.setFixedHeight(24 * HOUR_HEIGHT)
-        time_layout = QVBoxLayout(self._time_labels)
-        time_layout.setContentsMargins(0, 0, 0, 0)
-        time_layout.setSpacing(0)
-        
-        # Spacer to align labels with hour lines
-        top_spacer = QWidget()
-        top_spacer.setFixedHeight(0.5 * HOUR_HEIGHT)
-        time_layout.addWidget(top_spacer)
-        
-        # Labels 01:00 - 23:00 with AlignCenter
-        for hour in range(1, 24):
-            lbl = QLabel(f"{hour:02d}:00")
-            lbl.setFixedHeight(HOUR_HEIGHT)
-            lbl.setAlignment(Qt.AlignCenter)
-            time_layout.addWidget(lbl)
-        
-        bot_spacer = QWidget()
-        bot_spacer.setFixedHeight(0.5 * HOUR_HEIGHT)
-        time_layout.addWidget(bot_spacer)
+        self._time_labels = TimeLabelsWidget(time_col_width)
         
         # Time label scroll area (synced with main scroll)
         time_scroll = QScrollArea()
@@ -836,11 +1049,11 @@ class DayView(QWidget):
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         
         self._day_column = DayColumnWidget(self._date)
-        self._day_column.slot_clicked.connect(self.slot_clicked.emit)
-        self._day_column.slot_double_clicked.connect(self.slot_double_clicked.emit)
-        self._day_column.event_clicked.connect(self.event_clicked.emit)
-        self._day_column.event_double_clicked.connect(self.event_double_clicked.emit)
-        self._day_column.event_time_changed.connect(self.event_time_changed.emit)
+        self._day_column.slot_clicked.connect(self.slot_clicked)
+        self._day_column.slot_double_clicked.connect(self.slot_double_clicked)
+        self._day_column.event_clicked.connect(self.event_clicked)
+        self._day_column.event_double_clicked.connect(self.event_double_clicked)
+        self._day_column.event_time_changed.connect(self.event_time_changed)
         
         scroll.setWidget(self._day_column)
         self._scroll = scroll
@@ -867,40 +1080,34 @@ class DayView(QWidget):
         self.refresh_events()
     
     def set_events(self, events: list[EventData]):
-        self._events = events
+        self.set_event_index(EventIndex(events))
+    
+    def set_event_index(self, index: EventIndex):
+        self._event_index = index
         self.refresh_events()
     
     def refresh_events(self):
-        self._day_column.clear_portions()
-        self._all_day_row.clear_all()
-        
-        all_day_events = []
-        
-        for event in self._events:
-            local_start = to_local_datetime(event.start)
-            local_end = to_local_datetime(event.end)
+        # Switching back to this view with the same day and events leaves the widgets as they are
+        key = (self._date, self._event_index)
+        if key == self._shown_key:
+            return
+        self._shown_key = key
+        # Repaint the view once after the all-day row and the column are refilled
+        self.setUpdatesEnabled(False)
+        try:
+            # Add all-day events
+            self._all_day_row.set_events_bulk([self._event_index.all_day_events_on(self._date)])
             
-            if is_all_day_event(event):
-                # Check if this all-day event spans this date
-                start_date = local_start.date()
-                end_date = local_end.date()
-                # All-day events typically have end at midnight of next day, so subtract 1 day for display
-                if end_date > start_date:
-                    end_date = end_date - timedelta(days=1)
-                if start_date <= self._date <= end_date:
-                    all_day_events.append(event)
-            else:
-                # Timed event - create portion for this day
-                portion = EventPortion.create_for_day(event, self._date)
-                if portion:
-                    self._day_column.add_portion(portion)
-        
-        # Add all-day events
-        self._all_day_row.set_events_for_day(0, all_day_events)
-        self._all_day_row.update_height()
-        
-        # Finalize timed event portions
-        self._day_column.finalize_portions()
+            # Timed event portions for this day
+            self._day_column.set_portions(self._event_index.portions_on(self._date))
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def step_forward(self, d: date) -> date:
+        return d + _ONE_DAY
+    
+    def step_backward(self, d: date) -> date:
+        return d - _ONE_DAY
     
     def get_date_range(self) -> tuple[datetime, datetime]:
         start = datetime.combine(self._date, dt_time.min)
@@ -908,6 +1115,15 @@ class DayView(QWidget):
         return start, end
 
 
+@lru_cache(maxsize=8)
+def _week_header_styles(font_name: str, font_size: int, header_background: str,
+                        today_background: str, today_text: str) -> tuple[str, str]:
+    """Stylesheets (normal, today) for the week view day headers."""
+    base = f"font-family: '{font_name}'; font-size: {font_size}pt; font-weight: bold; padding: 8px;"
+    return (f"{base} background: {header_background};",
+            f"{base} background: {today_background}; color: {today_text};")
+
+
 class WeekView(QWidget):
     """Week view showing 7 days side by side with all-day events section."""
     
@@ -920,14 +1136,21 @@ class WeekView(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._start_date = self._get_week_start(date.today())
-        self._events: list[EventData] = []
+        self._event_index = EventIndex([])
+        self._shown_key: Optional[tuple] = None  # (date, index) the event widgets were last filled for
         self._day_columns: list[DayColumnWidget] = []
         self._setup_ui()
     
+    def _week_dates(self) -> list[date]:
+        """The seven dates of the displayed week."""
+        return [self._start_date + offset for offset in _DAY_OFFSETS[:7]]
+    
     def _get_week_start(self, d: date) -> date:
-        return d - timedelta(days=d.weekday())
+        return d - _DAY_OFFSETS[d.weekday()]
     
     def _setup_ui(self):
+        # One stylesheet for all day columns and all-day cells of this view
+        self.setStyleSheet(_day_grid_stylesheet())
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
@@ -937,8 +1160,7 @@ class WeekView(QWidget):
         
         # Header with day names
         # Account for scrollbar width on the right (typically ~16px on most systems)
-        from PySide6.QtWidgets import QApplication, QStyle
-        scrollbar_width = QApplication.style().pixelMetric(QStyle.PM_ScrollBarExtent)
+        scrollbar_width = _get_scrollbar_width()
         
         colors = get_colors_config()
         header = QWidget()
@@ -972,8 +1194,8 @@ class WeekView(QWidget):
         
         # All-day events row (7 days)
         self._all_day_row = AllDayEventsRow(num_days=7)
-        self._all_day_row.event_clicked.connect(self.event_clicked.emit)
-        self._all_day_row.event_double_clicked.connect(self.event_double_clicked.emit)
+        self._all_day_row.event_clicked.connect(self.event_clicked)
+        self._all_day_row.event_double_clicked.connect(self.event_double_clicked)
         self._all_day_row.hide()  # Hidden initially
         all_day_layout.addWidget(self._all_day_row, 1)
         
@@ -992,42 +1214,18 @@ class WeekView(QWidget):
         
         # Time labels
         colors = get_colors_config()
-        time_widget = QWidget()
-        time_widget.setFixedWidth(time_col_width)
-        time_widget.setFixedHeight(24 * HOUR_HEIGHT)
-        time_widget.setStyleSheet(f" background: {colors.header_background};")
-        time_layout = QVBoxLayout(time_widget)
-        time_layout.setContentsMargins(0, 0, 0, 0)
-        time_layout.setSpacing(0)
-        
-        # Spacer to align labels with hour lines
-        top_spacer = QWidget()
-        top_spacer.setFixedHeight(0.5* HOUR_HEIGHT)
-        time_layout.addWidget(top_spacer)
-        
-        # Labels 01:00 - 23:00 with AlignTop
-        for hour in range(1, 24):
-            lbl = QLabel(f"{hour:02d}:00")
-            lbl.setFixedHeight(HOUR_HEIGHT)
-            lbl.setAlignment(Qt.AlignCenter)
-            # lbl.setStyleSheet("padding-right: 5px; color: #666;")
-            time_layout.addWidget(lbl)
-        
-        bot_spacer = QWidget()
-        bot_spacer.setFixedHeight(0.5* HOUR_HEIGHT)
-        time_layout.addWidget(bot_spacer)
+        time_widget = TimeLabelsWidget(time_col_width, colors.header_background)
 
         content_layout.addWidget(time_widget)
         
         # Day columns
-        for i in range(7):
-            d = self._start_date + timedelta(days=i)
+        for d in self._week_dates():
             col = DayColumnWidget(d)
-            col.slot_clicked.connect(self.slot_clicked.emit)
-            col.slot_double_clicked.connect(self.slot_double_clicked.emit)
-            col.event_clicked.connect(self.event_clicked.emit)
-            col.event_double_clicked.connect(self.event_double_clicked.emit)
-            col.event_time_changed.connect(self.event_time_changed.emit)
+            col.slot_clicked.connect(self.slot_clicked)
+            col.slot_double_clicked.connect(self.slot_double_clicked)
+            col.event_clicked.connect(self.event_clicked)
+            col.event_double_clicked.connect(self.event_double_clicked)
+            col.event_time_changed.connect(self.event_time_changed)
             content_layout.addWidget(col, 1)
             self._day_columns.append(col)
         
@@ -1048,73 +1246,60 @@ class WeekView(QWidget):
         localization = get_localization_config()
         colors = get_colors_config()
         font_name, font_size = get_interface_font()
-        for i, label in enumerate(self._header_labels):
-            d = self._start_date + timedelta(days=i)
+        normal_style, today_style = _week_header_styles(
+            font_name, font_size, colors.header_background,
+            colors.today_highlight_background, colors.today_highlight_text)
+        today = date.today()
+        for i, (label, d) in enumerate(zip(self._header_labels, self._week_dates())):
             day_name = localization.get_day_name(i)
             label.setText(f"{day_name} {d.day}")
-            if d == date.today():
-                label.setStyleSheet(f"font-family: '{font_name}'; font-size: {font_size}pt; font-weight: bold; padding: 8px; background: {colors.today_highlight_background}; color: {colors.today_highlight_text};")
-            else:
-                label.setStyleSheet(f"font-family: '{font_name}'; font-size: {font_size}pt; font-weight: bold; padding: 8px; background: {colors.header_background};")
+            style = today_style if d == today else normal_style
+            # Qt re-parses and re-polishes on every setStyleSheet, so only apply changes
+            if label.styleSheet() != style:
+                label.setStyleSheet(style)
     
     def set_date(self, d: date):
         self._start_date = self._get_week_start(d)
-        for i, col in enumerate(self._day_columns):
-            col.set_date(self._start_date + timedelta(days=i))
+        for col, day_date in zip(self._day_columns, self._week_dates()):
+            col.set_date(day_date)
         self._update_headers()
         self.refresh_events()
     
     def set_events(self, events: list[EventData]):
-        self._events = events
+        self.set_event_index(EventIndex(events))
+    
+    def set_event_index(self, index: EventIndex):
+        self._event_index = index
         self.refresh_events()
     
     def refresh_events(self):
-        for col in self._day_columns:
-            col.clear_portions()
-        self._all_day_row.clear_all()
-        
-        # Group events by day and type (all-day vs timed)
-        all_day_by_day: list[list[EventData]] = [[] for _ in range(7)]
-        
-        for event in self._events:
-            local_start = to_local_datetime(event.start)
-            local_end = to_local_datetime(event.end)
+        # Switching back to this view with the same week and events leaves the widgets as they are
+        key = (self._start_date, self._event_index)
+        if key == self._shown_key:
+            return
+        self._shown_key = key
+        week_dates = self._week_dates()
+        # Repaint the view once after the all-day row and all seven columns are refilled
+        self.setUpdatesEnabled(False)
+        try:
+            # All-day events, and the row height (same height for all days, based on max)
+            self._all_day_row.set_events_bulk([self._event_index.all_day_events_on(d) for d in week_dates])
             
-            if is_all_day_event(event):
-                # Multi-day all-day events should appear on each day they span
-                start_date = local_start.date()
-                end_date = local_end.date()
-                # All-day events typically have end at midnight of next day, so subtract 1 day for display
-                if end_date > start_date:
-                    end_date = end_date - timedelta(days=1)
-                
-                # Add to each day in the week that this event spans
-                for day_idx in range(7):
-                    day_date = self._start_date + timedelta(days=day_idx)
-                    if start_date <= day_date <= end_date:
-                        all_day_by_day[day_idx].append(event)
-            else:
-                # Timed event - create portions for each day it spans
-                for day_idx in range(7):
-                    day_date = self._start_date + timedelta(days=day_idx)
-                    portion = EventPortion.create_for_day(event, day_date)
-                    if portion:
-                        self._day_columns[day_idx].add_portion(portion)
-        
-        # Add all-day events to their respective day cells
-        for day_idx, events in enumerate(all_day_by_day):
-            self._all_day_row.set_events_for_day(day_idx, events)
-        
-        # Finalize event layouts for all day columns
-        for col in self._day_columns:
-            col.finalize_portions()
-        
-        # Update the all-day row height (same height for all days, based on max)
-        self._all_day_row.update_height()
+            for col, day_date in zip(self._day_columns, week_dates):
+                # Timed event portions for this day, laid out in one pass
+                col.set_portions(self._event_index.portions_on(day_date))
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def step_forward(self, d: date) -> date:
+        return d + _ONE_WEEK
+    
+    def step_backward(self, d: date) -> date:
+        return d - _ONE_WEEK
     
     def get_date_range(self) -> tuple[datetime, datetime]:
         start = datetime.combine(self._start_date, dt_time.min)
-        end = datetime.combine(self._start_date + timedelta(days=6), dt_time.max)
+        end = datetime.combine(self._start_date + _DAY_OFFSETS[6], dt_time.max)
         return start, end
     
     def refresh_styles(self):
@@ -1122,28 +1307,104 @@ class WeekView(QWidget):
         self._update_headers()
 
 
+def _shift_month(d: date, months: int) -> date:
+    """Move d by a number of months, clamping the day to the target month (Jan 31 -> Feb 28)."""
+    year, month0 = divmod(d.year * 12 + d.month - 1 + months, 12)
+    month = month0 + 1
+    return date(year, month, min(d.day, calendar.monthrange(year, month)[1]))
+
+
+@lru_cache(maxsize=24)
+def _month_grid_dates(year: int, month: int) -> tuple[tuple[date, bool], ...]:
+    """The 42 (date, is_current_month) pairs of a month grid starting on Monday."""
+    first_day = date(year, month, 1)
+    grid_start = first_day - _DAY_OFFSETS[first_day.weekday()]
+    grid = []
+    for offset in _DAY_OFFSETS:
+        cell_date = grid_start + offset
+        grid.append((cell_date, cell_date.month == month))
+    return tuple(grid)
+
+
+@lru_cache(maxsize=16)
+def _month_cell_styles(background: str, text: str, border: str, is_today: bool,
+                       today_background: str, today_text: str) -> tuple[str, str]:
+    """Stylesheets (cell, day label) for a month view cell."""
+    if is_today:
+        label_style = f"color: {today_text}; font-weight: bold; background: {today_background}; border-radius: 10px; padding: 2px 6px;"
+    else:
+        label_style = f"color: {text};"
+    return f"background-color: {background}; border: 1px solid {border};", label_style
+
+
+class MoreEventsLabel(QLabel):
+    """Clickable "+N more" label at the bottom of a month cell."""
+    
+    clicked = Signal()
+    
+    def mousePressEvent(self, event: QMouseEvent):
+        # Accept the press so the cell does not also handle it as a day click
+        if event.button() == Qt.LeftButton:
+            self.clicked.emit()
+
+
+class MoreEventsPopup(QFrame):
+    """Popup listing all events of a month day, opened from the cell's "+N more" label."""
+    
+    event_clicked = Signal(EventData)
+    event_double_clicked = Signal(EventData)
+    
+    def __init__(self, d: date, events: list[EventData], parent=None):
+        super().__init__(parent, Qt.Popup)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.setFrameStyle(QFrame.Box | QFrame.Plain)
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        layout.setSpacing(1)
+        
+        localization = get_localization_config()
+        header = QLabel(f"{d.day} {localization.get_month_name(d.month)}")
+        header.setStyleSheet("font-weight: bold;")
+        layout.addWidget(header)
+        
+        # The widgets for the remaining events are only built here, when asked for
+        event_height = _get_single_line_event_height()
+        for event in events:
+            widget = EventWidget(event, compact=True, show_time=True, show_location=False)
+            widget.setFixedHeight(event_height)
+            widget.clicked.connect(self.event_clicked)
+            widget.double_clicked.connect(self._on_event_double_clicked)
+            layout.addWidget(widget)
+    
+    def _on_event_double_clicked(self, event: EventData):
+        self.close()
+        self.event_double_clicked.emit(event)
+
+
 class MonthDayCell(QFrame):
     """Single day cell in month view."""
     
     clicked = Signal(date)
     double_clicked = Signal(date)
+    more_clicked = Signal(date)
     event_clicked = Signal(EventData)
     event_double_clicked = Signal(EventData)
     event_drag_started = Signal(EventData, DragMode, int)
-    event_drag_moved = Signal(EventData, DragMode, object)  # QPoint
-    event_drag_finished = Signal(EventData, DragMode, object)  # QPoint
+    event_drag_moved = Signal(EventData, DragMode, QPoint)
+    event_drag_finished = Signal(EventData, DragMode, QPoint)
     
     def __init__(self, d: date, is_current_month: bool = True, parent=None):
         super().__init__(parent)
-        self._date = d
+        self.date = d  # Plain attribute: read for every cell on each refresh
         self.is_current_month = is_current_month
         self._event_widgets: list[EventWidget] = []
+        # Hidden widgets kept for reuse by _add_event_widget(), per widget class
+        self._widget_pool: dict[type, list[EventWidget]] = {EventWidget: [], DraggableEventWidget: []}
+        self._hidden_count = 0  # Events beyond the month_max_events limit
+        self._more_label: Optional[MoreEventsLabel] = None  # Created on first overflow
         self._setup_ui()
     
-    @property
-    def date(self):
-        return self._date
-    
     def _setup_ui(self):
         self.setFrameStyle(QFrame.Box | QFrame.Plain)
         # Calculate minimum size based on font metrics
@@ -1160,7 +1421,7 @@ class MonthDayCell(QFrame):
         layout.setContentsMargins(4, 4, 4, 4)
         layout.setSpacing(2)
         
-        self._day_label = QLabel(str(self._date.day))
+        self._day_label = QLabel(str(self.date.day))
         self._day_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
         layout.addWidget(self._day_label)
         
@@ -1171,57 +1432,98 @@ class MonthDayCell(QFrame):
         
         self._update_style()
     
-    def _update_style(self):
+    def _update_style(self, today: Optional[date] = None):
         colors = get_colors_config()
+        if today is None:
+            today = date.today()
         bg = colors.month_cell_current if self.is_current_month else colors.month_cell_other
         text = colors.month_text_current if self.is_current_month else colors.month_text_other
-        
-        if self._date == date.today():
-            self._day_label.setStyleSheet(f"color: {colors.today_highlight_text}; font-weight: bold; background: {colors.today_highlight_background}; border-radius: 10px; padding: 2px 6px;")
-        else:
-            self._day_label.setStyleSheet(f"color: {text};")
-        
-        self.setStyleSheet(f"background-color: {bg}; border: 1px solid {colors.cell_border};")
-    
-    def set_date(self, d: date, is_current_month: bool = True):
-        self._date = d
+        cell_style, label_style = _month_cell_styles(
+            bg, text, colors.cell_border, self.date == today,
+            colors.today_highlight_background, colors.today_highlight_text)
+        
+        # Qt re-parses and re-polishes on every setStyleSheet, so only apply changes
+        if self._day_label.styleSheet() != label_style:
+            self._day_label.setStyleSheet(label_style)
+        if self.styleSheet() != cell_style:
+            self.setStyleSheet(cell_style)
+    
+    def set_date(self, d: date, is_current_month: bool = True, today: Optional[date] = None):
+        self.date = d
         self.is_current_month = is_current_month
         self._day_label.setText(str(d.day))
-        self._update_style()
+        self._update_style(today)
         self.clear_events()
     
-    def add_event(self, event: EventData):
+    def set_events(self, events: list[EventData]):
+        """Replace the cell's events in one pass - the "+N more" label is set once, not per hidden event."""
+        self.clear_events()
+        max_events = _layout_config.month_max_events
+        shown = events[:max_events] if max_events > 0 else events
+        for event in shown:
+            self._add_event_widget(event)
+        if len(events) > len(shown):
+            self._hidden_count = len(events) - len(shown)
+            self._update_more_label()
+    
+    def _add_event_widget(self, event: EventData):
         # Month view: title only, no location
         # Use DraggableEventWidget for editable events
-        if event.read_only:
-            widget = EventWidget(event, compact=True, show_time=False, show_location=False)
+        widget_class = EventWidget if event.read_only else DraggableEventWidget
+        pool = self._widget_pool[widget_class]
+        if pool:
+            widget = pool.pop()
+            widget.set_event(event)
+            widget.show()
         else:
-            widget = DraggableEventWidget(event, compact=True, show_time=False, show_location=False)
-            widget.drag_started.connect(self.event_drag_started.emit)
-            widget.drag_moved.connect(lambda e, m, p: self.event_drag_moved.emit(e, m, p))
-            widget.drag_finished.connect(lambda e, m, p: self.event_drag_finished.emit(e, m, p))
-        
-        event_height = _get_single_line_event_height()
-        widget.setMaximumHeight(event_height)
-        widget.clicked.connect(self.event_clicked.emit)
-        widget.double_clicked.connect(self.event_double_clicked.emit)
+            widget = widget_class(event, compact=True, show_time=False, show_location=False)
+            if widget_class is DraggableEventWidget:
+                widget.drag_started.connect(self.event_drag_started)
+                widget.drag_moved.connect(self.event_drag_moved)
+                widget.drag_finished.connect(self.event_drag_finished)
+            
+            event_height = _get_single_line_event_height()
+            widget.setMaximumHeight(event_height)
+            widget.clicked.connect(self.event_clicked)
+            widget.double_clicked.connect(self.event_double_clicked)
         self._events_layout.addWidget(widget)
         self._event_widgets.append(widget)
     
     def clear_events(self):
+        # Take the widgets out of the layout and keep them for _add_event_widget() instead of deleting them
         for widget in self._event_widgets:
             widget.hide()  # Hide immediately to prevent visual duplication
-            widget.deleteLater()
+            self._events_layout.removeWidget(widget)
+            self._widget_pool[type(widget)].append(widget)
         self._event_widgets.clear()
+        if self._hidden_count:
+            self._more_label.hide()
+            self._events_layout.removeWidget(self._more_label)
+            self._hidden_count = 0
+    
+    def _update_more_label(self):
+        """Show "+N more" below the event widgets for the events that are not shown."""
+        if self._more_label is None:
+            self._more_label = MoreEventsLabel()
+            self._more_label.setMaximumHeight(_get_single_line_event_height())
+            self._more_label.clicked.connect(self._on_more_clicked)
+        self._more_label.setText(get_labels_config().more_events.format(self._hidden_count))
+        if self._more_label.isHidden():
+            # First overflow of this fill: all shown event widgets are in place
+            self._events_layout.addWidget(self._more_label)
+            self._more_label.show()
+    
+    def _on_more_clicked(self):
+        self.more_clicked.emit(self.date)
 
     def mousePressEvent(self, event: QMouseEvent):
         if event.button() == Qt.LeftButton:
-            self.clicked.emit(self._date)
+            self.clicked.emit(self.date)
         super().mousePressEvent(event)
     
     def mouseDoubleClickEvent(self, event: QMouseEvent):
         if event.button() == Qt.LeftButton:
-            self.double_clicked.emit(self._date)
+            self.double_clicked.emit(self.date)
         super().mouseDoubleClickEvent(event)
 
 
@@ -1238,8 +1540,11 @@ class MonthView(QWidget):
         super().__init__(parent)
         self._year = date.today().year
         self._month = date.today().month
-        self._events: list[EventData] = []
+        self._event_index = EventIndex([])
         self._cells: list[MonthDayCell] = []
+        self._cell_by_date: dict[date, MonthDayCell] = {}
+        self._grid_key: Optional[tuple[int, int, date]] = None  # (year, month, today) the cells show
+        self._refresh_pending = False  # A refresh_events() call waits for the event loop
         self._dragging_event: Optional[EventData] = None
         self._drag_original_start: Optional[datetime] = None
         self._drag_original_end: Optional[datetime] = None
@@ -1260,11 +1565,12 @@ class MonthView(QWidget):
         font_name, font_size = get_interface_font()
         localization = get_localization_config()
         colors = get_colors_config()
+        header_style = f"font-family: '{font_name}'; font-size: {font_size}pt; font-weight: bold; padding: 8px; background: {colors.header_background};"
         for i in range(7):
             day_name = localization.get_day_name(i)
             label = QLabel(day_name)
             label.setAlignment(Qt.AlignCenter)
-            label.setStyleSheet(f"font-family: '{font_name}'; font-size: {font_size}pt; font-weight: bold; padding: 8px; background: {colors.header_background};")
+            label.setStyleSheet(header_style)
             header_layout.addWidget(label, 1)
             self._header_labels.append(label)
         
@@ -1283,10 +1589,12 @@ class MonthView(QWidget):
         for row in range(6):
             for col in range(7):
                 cell = MonthDayCell(date.today())
-                cell.clicked.connect(self.day_clicked.emit)
-                cell.double_clicked.connect(self.day_double_clicked.emit)
-                cell.event_clicked.connect(self.event_clicked.emit)
-                cell.event_double_clicked.connect(self.event_double_clicked.emit)
+                # Signal-to-signal connections are forwarded by Qt without a Python call
+                cell.clicked.connect(self.day_clicked)
+                cell.double_clicked.connect(self.day_double_clicked)
+                cell.more_clicked.connect(self._show_more_events)
+                cell.event_clicked.connect(self.event_clicked)
+                cell.event_double_clicked.connect(self.event_double_clicked)
                 cell.event_drag_started.connect(self._on_drag_started)
                 cell.event_drag_finished.connect(self._on_drag_finished)
                 self._grid_layout.addWidget(cell, row, col)
@@ -1296,55 +1604,72 @@ class MonthView(QWidget):
         self._update_grid()
     
     def _update_grid(self):
-        first_day = date(self._year, self._month, 1)
-        start_offset = first_day.weekday()
-        grid_start = first_day - timedelta(days=start_offset)
-        
-        for i, cell in enumerate(self._cells):
-            cell_date = grid_start + timedelta(days=i)
-            is_current = cell_date.month == self._month
-            cell.set_date(cell_date, is_current)
+        today = date.today()
+        self._grid_key = (self._year, self._month, today)
+        for cell, (cell_date, is_current) in zip(self._cells, _month_grid_dates(self._year, self._month)):
+            cell.set_date(cell_date, is_current, today)
+        self._cell_by_date = {cell.date: cell for cell in self._cells}
     
     def set_month(self, year: int, month: int):
+        # Navigating within the displayed month leaves the grid unchanged (unless the day rolled over)
+        if self._grid_key == (year, month, date.today()):
+            return
         self._year = year
         self._month = month
-        self._update_grid()
-        self.refresh_events()
+        # Repaint the grid once after all cells are updated, not per cell
+        self.setUpdatesEnabled(False)
+        try:
+            self._update_grid()
+            self._fill_cells()
+        finally:
+            self.setUpdatesEnabled(True)
+        self._refresh_pending = False  # The cells are filled already
     
     def set_date(self, d: date):
         self.set_month(d.year, d.month)
     
     def set_events(self, events: list[EventData]):
-        self._events = events
+        self.set_event_index(EventIndex(events))
+    
+    def set_event_index(self, index: EventIndex):
+        self._event_index = index
         self.refresh_events()
     
     def refresh_events(self):
+        """Refill the cells on the next event loop pass, so back-to-back calls cost one refill."""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._do_refresh)
+    
+    def _do_refresh(self):
+        if not self._refresh_pending:
+            return  # set_month() refilled the cells in the meantime
+        self._refresh_pending = False
+        self.setUpdatesEnabled(False)
+        try:
+            self._fill_cells()
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _fill_cells(self):
         for cell in self._cells:
-            cell.clear_events()
-        
-        for event in self._events:
-            local_start = to_local_datetime(event.start)
-            local_end = to_local_datetime(event.end)
-            
-            if is_all_day_event(event):
-                # Multi-day all-day events should appear on each day they span
-                start_date = local_start.date()
-                end_date = local_end.date()
-                # All-day events typically have end at midnight of next day, so subtract 1 day for display
-                if end_date > start_date:
-                    end_date = end_date - timedelta(days=1)
-                
-                # Add to each cell that falls within the event's date range
-                for cell in self._cells:
-                    if start_date <= cell.date <= end_date:
-                        cell.add_event(event)
-            else:
-                # Timed event - only show on start day
-                event_date = local_start.date()
-                for cell in self._cells:
-                    if cell.date == event_date:
-                        cell.add_event(event)
-                        break
+            cell.set_events(self._event_index.month_events_on(cell.date))
+    
+    def _show_more_events(self, d: date):
+        """Open a popup with all events of a day whose cell hides some of them."""
+        cell = self._cell_by_date[d]
+        popup = MoreEventsPopup(d, self._event_index.month_events_on(d), self)
+        popup.event_clicked.connect(self.event_clicked)
+        popup.event_double_clicked.connect(self.event_double_clicked)
+        popup.setMinimumWidth(cell.width())
+        popup.move(cell.mapToGlobal(QPoint(0, 0)))
+        popup.show()
+    
+    def step_forward(self, d: date) -> date:
+        return _shift_month(d, 1)
+    
+    def step_backward(self, d: date) -> date:
+        return _shift_month(d, -1)
     
     def get_date_range(self) -> tuple[datetime, datetime]:
         start = datetime.combine(self._cells[0].date, dt_time.min)
@@ -1359,19 +1684,11 @@ class MonthView(QWidget):
     
     def _find_target_day_cell(self, global_pos) -> Optional[date]:
         """Find which MonthDayCell is under the global position."""
-        from PySide6.QtWidgets import QApplication
-        
-        widget_at_pos = QApplication.widgetAt(global_pos)
-        if widget_at_pos is None:
-            return None
-        
-        # Walk up the widget tree to find a MonthDayCell
-        current = widget_at_pos
-        while current is not None:
-            if isinstance(current, MonthDayCell):
-                return current._date
-            current = current.parentWidget()
-        
+        # All cells share the grid widget as parent: map once, then test their geometries
+        pos = self._cells[0].parentWidget().mapFromGlobal(global_pos)
+        for cell in self._cells:
+            if cell.geometry().contains(pos):
+                return cell.date
         return None
     
     def _on_drag_finished(self, event: EventData, mode: DragMode, global_pos):
@@ -1407,8 +1724,41 @@ class MonthView(QWidget):
         """Refresh header styles after config change."""
         font_name, font_size = get_interface_font()
         colors = get_colors_config()
+        header_style = f"font-family: '{font_name}'; font-size: {font_size}pt; font-weight: bold; padding: 8px; background: {colors.header_background};"
         for label in self._header_labels:
-            label.setStyleSheet(f"font-family: '{font_name}'; font-size: {font_size}pt; font-weight: bold; padding: 8px; background: {colors.header_background};")
+            label.setStyleSheet(header_style)
+
+
+@lru_cache(maxsize=64)
+def _list_event_style(bg_color: str) -> str:
+    """Stylesheet for a ListEventWidget of the given calendar color."""
+    text_color = get_contrasting_text_color(bg_color)
+    border_color = bg_color
+    bg_lighter = lighten_color(bg_color, 0.4)
+    
+    return f"""
+        ListEventWidget {{
+            background-color: {bg_lighter};
+            border: 2px solid {border_color};
+            border-left: 4px solid {border_color};
+            border-radius: 4px;
+            color: {text_color};
+        }}
+        ListEventWidget:hover {{
+            background-color: {lighten_color(bg_color, 0.2)};
+        }}
+        QLabel {{
+            color: {text_color};
+            background: transparent;
+            border: none;
+        }}
+    """
+
+
+def _list_event_key(event: EventData) -> tuple:
+    """Everything a ListEventWidget shows of an event - equal keys can share a widget."""
+    return (event.start, event.end, event.all_day, event.summary, event.location, event.description,
+            event.calendar_name, event.calendar_color, event.is_recurring, event.read_only)
 
 
 class ListEventWidget(QFrame):
@@ -1439,8 +1789,8 @@ class ListEventWidget(QFrame):
         
         # Build two-line date/time text
         if self.event_data.all_day:
-            # All-day: "YYYY/mm/dd" + "(Allday)"
-            line1 = local_start.strftime("%Y/%m/%d")
+            # All-day: "YYYY/mm/dd" + "(Allday)" - stored at UTC midnight of the floating date
+            line1 = self.event_data.start.strftime("%Y/%m/%d")
             line2 = "(Allday)"
         else:
             # Timed: "YYYY/mm/dd HH:mm" + "to: mm/dd HH:mm"
@@ -1452,10 +1802,9 @@ class ListEventWidget(QFrame):
         datetime_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
         
         # Calculate width dynamically based on longest possible line
-        fm = QFontMetrics(text_font)
         # Sample text for width calculation: "YYYY/mm/dd HH:mm" is the widest format
         sample_text = "0000/00/00 00:00"
-        datetime_width = fm.horizontalAdvance(sample_text) + 8  # Add small padding
+        datetime_width = _text_advance(text_font.family(), text_font.pointSize(), sample_text) + 8  # Add small padding
         datetime_label.setFixedWidth(datetime_width)
         
         layout.addWidget(datetime_label, 0, Qt.AlignTop)
@@ -1508,33 +1857,18 @@ class ListEventWidget(QFrame):
         self.setFrameStyle(QFrame.StyledPanel | QFrame.Plain)
         self.setCursor(Qt.PointingHandCursor)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
+        
+        # Indicator triangles for paintEvent: size measured once, shapes follow resizeEvent
+        self._triangle_size = QFontMetrics(self.font()).height() // 2
+        self._recurring_triangle = QPolygonF()
+        self._readonly_triangle = QPolygonF()
     
     def _apply_style(self):
         """Apply color styling based on the event's calendar color."""
-        from .event_widget import get_contrasting_text_color, lighten_color
-        
-        bg_color = self.event_data.calendar_color
-        text_color = get_contrasting_text_color(bg_color)
-        border_color = bg_color
-        bg_lighter = lighten_color(bg_color, 0.4)
-        
-        self.setStyleSheet(f"""
-            ListEventWidget {{
-                background-color: {bg_lighter};
-                border: 2px solid {border_color};
-                border-left: 4px solid {border_color};
-                border-radius: 4px;
-                color: {text_color};
-            }}
-            ListEventWidget:hover {{
-                background-color: {lighten_color(bg_color, 0.2)};
-            }}
-            QLabel {{
-                color: {text_color};
-                background: transparent;
-                border: none;
-            }}
-        """)
+        self.setStyleSheet(_list_event_style(self.event_data.calendar_color))
+        # Indicator triangles contrast with the lightened background
+        bg_color = lighten_color(self.event_data.calendar_color, 0.4)
+        self._triangle_brush = QBrush(QColor(get_contrasting_text_color(bg_color)))
     
     def mousePressEvent(self, event: QMouseEvent):
         if event.button() == Qt.LeftButton:
@@ -1553,43 +1887,39 @@ class ListEventWidget(QFrame):
         if not self.event_data.is_recurring and not self.event_data.read_only:
             return
         
-        from PySide6.QtGui import QPainter, QBrush, QColor, QPolygonF
-        from .event_widget import get_contrasting_text_color, lighten_color
-        
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        fm = QFontMetrics(self.font())
-        triangle_size = fm.height() // 2
-        
-        w = self.width()
-        h = self.height()
-        
-        bg_color = lighten_color(self.event_data.calendar_color, 0.4)
-        triangle_color = get_contrasting_text_color(bg_color)
-        
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(QColor(triangle_color)))
+        painter.setBrush(self._triangle_brush)
         
         if self.event_data.is_recurring:
-            from PySide6.QtCore import QPointF
-            recurring_points = QPolygonF([
-                QPointF(0, h),
-                QPointF(triangle_size, h),
-                QPointF(0, h - triangle_size)
-            ])
-            painter.drawPolygon(recurring_points)
+            painter.drawPolygon(self._recurring_triangle)
         
         if self.event_data.read_only:
-            from PySide6.QtCore import QPointF
-            readonly_points = QPolygonF([
-                QPointF(w, h),
-                QPointF(w - triangle_size, h),
-                QPointF(w, h - triangle_size)
-            ])
-            painter.drawPolygon(readonly_points)
+            painter.drawPolygon(self._readonly_triangle)
         
         painter.end()
+    
+    def resizeEvent(self, event):
+        """Rebuild the indicator triangles for the new size, so paintEvent only draws them."""
+        super().resizeEvent(event)
+        if not self.event_data.is_recurring and not self.event_data.read_only:
+            return
+        
+        triangle_size = self._triangle_size
+        w = self.width()
+        h = self.height()
+        self._recurring_triangle = QPolygonF([
+            QPointF(0, h),
+            QPointF(triangle_size, h),
+            QPointF(0, h - triangle_size)
+        ])
+        self._readonly_triangle = QPolygonF([
+            QPointF(w, h),
+            QPointF(w - triangle_size, h),
+            QPointF(w, h - triangle_size)
+        ])
 
 
 class ListView(QWidget):
@@ -1601,8 +1931,10 @@ class ListView(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._events: list[EventData] = []
+        self._event_index = EventIndex([])
         self._event_widgets: list[ListEventWidget] = []
+        # Widgets of the previous refresh, by what they display, for reuse by the batches
+        self._reusable_widgets: dict[tuple, list[ListEventWidget]] = {}
         self._current_date = date.today()
         self._sorted_events: list[EventData] = []  # Keep sorted list for navigation
         self._pending_scroll_datetime: Optional[datetime] = None  # Scroll target applied after events load
@@ -1630,11 +1962,20 @@ class ListView(QWidget):
         self._scroll.setWidget(self._content)
         main_layout.addWidget(self._scroll)
         
-        # Connect scroll to detect visible range
+        # Connect scroll to detect visible range - valueChanged fires for every scrolled pixel,
+        # so the range is computed once the scrolling pauses for a frame
+        self._visible_range_timer = QTimer(self)
+        self._visible_range_timer.setSingleShot(True)
+        self._visible_range_timer.setInterval(16)
+        self._visible_range_timer.timeout.connect(self._emit_visible_range)
         self._scroll.verticalScrollBar().valueChanged.connect(self._on_scroll)
     
     def _on_scroll(self):
-        """Handle scroll event to update visible range."""
+        """Handle scroll event: (re)start the timer that reports the visible range."""
+        self._visible_range_timer.start()
+    
+    def _emit_visible_range(self):
+        """Emit visible_range_changed for the events currently in the viewport."""
         visible_range = self.get_visible_date_range()
         if visible_range[0] and visible_range[1]:
             self.visible_range_changed.emit(visible_range[0], visible_range[1])
@@ -1645,23 +1986,38 @@ class ListView(QWidget):
     
     def set_events(self, events: list[EventData]):
         """Set events and rebuild the list."""
-        self._events = events
+        self.set_event_index(EventIndex(events))
+    
+    def set_event_index(self, index: EventIndex):
+        """Set pre-indexed events and rebuild the list."""
+        self._event_index = index
         self._refresh_display()
     
-    def _refresh_display(self):
-        """Rebuild the event list display progressively to avoid UI blocking."""
+    def _refresh_display(self, reuse_widgets: bool = True):
+        """Rebuild the event list display progressively to avoid UI blocking.
+        
+        Args:
+            reuse_widgets: Keep the current widgets for events that look the same
+                          in the new list; False rebuilds all of them.
+        """
         # Increment generation to invalidate any pending batch timers from previous refresh
         self._batch_generation += 1
         current_generation = self._batch_generation
         
-        # Clear existing widgets
+        # Take the existing widgets out of the list, keeping them for events that display the same
         for widget in self._event_widgets:
             widget.hide()  # Hide immediately to prevent visual duplication
-            widget.deleteLater()
+            self._content_layout.removeWidget(widget)
+            if reuse_widgets:
+                self._reusable_widgets.setdefault(_list_event_key(widget.event_data), []).append(widget)
+            else:
+                widget.deleteLater()
         self._event_widgets.clear()
+        if not reuse_widgets:
+            self._discard_reusable_widgets()
         
-        # Sort events chronologically
-        self._sorted_events = sorted(self._events, key=lambda e: to_local_datetime(e.start))
+        # Events chronologically (sorted when the index was built)
+        self._sorted_events = self._event_index.sorted_events
         
         # Remove the stretch at the end temporarily (if exists)
         if self._content_layout.count() > 0:
@@ -1687,22 +2043,33 @@ class ListView(QWidget):
             return  # Stale batch - a newer _refresh_display() call superseded this
         
         if self._pending_events_index >= len(self._sorted_events):
-            # All done - finalize
+            # All done - widgets of events no longer in the list are not needed anymore
+            self._discard_reusable_widgets()
             self._finalize_display()
             return
         
-        # Create a batch of widgets
+        # Create a batch of widgets (or take them from the previous refresh), repainting once
         end_index = min(self._pending_events_index + batch_size, len(self._sorted_events))
         
-        for i in range(self._pending_events_index, end_index):
-            event = self._sorted_events[i]
-            widget = ListEventWidget(event)
-            widget.clicked.connect(self.event_clicked.emit)
-            widget.double_clicked.connect(self.event_double_clicked.emit)
-            # Insert before the stretch (which is at the end)
-            insert_pos = self._content_layout.count() - 1
-            self._content_layout.insertWidget(insert_pos, widget)
-            self._event_widgets.append(widget)
+        self._content.setUpdatesEnabled(False)
+        try:
+            for i in range(self._pending_events_index, end_index):
+                event = self._sorted_events[i]
+                reusable = self._reusable_widgets.get(_list_event_key(event))
+                if reusable:
+                    widget = reusable.pop()
+                    widget.event_data = event  # Displays the same; clicks report the new object
+                else:
+                    widget = ListEventWidget(event)
+                    widget.clicked.connect(self.event_clicked)
+                    widget.double_clicked.connect(self.event_double_clicked)
+                # Insert before the stretch (which is at the end)
+                insert_pos = self._content_layout.count() - 1
+                self._content_layout.insertWidget(insert_pos, widget)
+                widget.show()
+                self._event_widgets.append(widget)
+        finally:
+            self._content.setUpdatesEnabled(True)
         
         self._pending_events_index = end_index
         
@@ -1710,6 +2077,13 @@ class ListView(QWidget):
         current_gen = self._batch_generation
         QTimer.singleShot(0, lambda: self._create_widgets_batch(generation=current_gen))
     
+    def _discard_reusable_widgets(self):
+        """Delete the kept widgets that no event of the current list took."""
+        for widgets in self._reusable_widgets.values():
+            for widget in widgets:
+                widget.deleteLater()
+        self._reusable_widgets.clear()
+    
     def _finalize_display(self):
         """Called after all widgets are created."""
         # Apply pending scroll if set (after events are loaded)
@@ -1719,38 +2093,29 @@ class ListView(QWidget):
             QTimer.singleShot(50, lambda: self.scroll_to_datetime(target_dt))
         
         # Emit visible range after layout is complete
-        def _emit_visible_range():
-            visible_range = self.get_visible_date_range()
-            if visible_range[0] and visible_range[1]:
-                self.visible_range_changed.emit(visible_range[0], visible_range[1])
-        QTimer.singleShot(100, _emit_visible_range)
+        QTimer.singleShot(100, self._emit_visible_range)
     
     def get_visible_date_range(self) -> tuple[Optional[datetime], Optional[datetime]]:
         """Get the date range of currently visible events."""
         if not self._event_widgets:
             return (None, None)
         
-        viewport = self._scroll.viewport()
         scroll_pos = self._scroll.verticalScrollBar().value()
-        viewport_height = viewport.height()
-        
-        first_visible: Optional[datetime] = None
-        last_visible: Optional[datetime] = None
-        
-        for widget in self._event_widgets:
-            # Get widget position relative to scroll area
-            widget_pos = widget.mapTo(self._content, widget.rect().topLeft())
-            widget_top = widget_pos.y()
-            widget_bottom = widget_top + widget.height()
-            
-            # Check if widget is visible
-            if widget_bottom > scroll_pos and widget_top < scroll_pos + viewport_height:
-                event_start = to_local_datetime(widget.event_data.start)
-                if first_visible is None:
-                    first_visible = event_start
-                last_visible = event_start
+        viewport_bottom = scroll_pos + self._scroll.viewport().height()
+        
+        # The widgets are stacked top to bottom in the content layout, so once it is laid out
+        # their positions are sorted: binary search for the first and last one overlapping the
+        # viewport. Mid-fill, reused widgets still have their geometry from the previous list
+        # until the pending relayout, so apply it first.
+        self._content_layout.activate()
+        widgets = self._event_widgets
+        first = bisect_right(widgets, scroll_pos, key=lambda w: w.y() + w.height())
+        last = bisect_left(widgets, viewport_bottom, key=lambda w: w.y()) - 1
+        if first > last:
+            return (None, None)
         
-        return (first_visible, last_visible)
+        return (to_local_datetime(widgets[first].event_data.start),
+                to_local_datetime(widgets[last].event_data.start))
     
     def get_first_visible_datetime(self) -> Optional[datetime]:
         """Get the datetime of the first visible event (top of view)."""
@@ -1765,20 +2130,10 @@ class ListView(QWidget):
         if not self._event_widgets:
             return
         
-        # Find the first event at or after target_dt
-        target_widget = None
-        for widget in self._event_widgets:
-            event_start = to_local_datetime(widget.event_data.start)
-            # Remove timezone info for comparison
-            event_start_naive = event_start.replace(tzinfo=None) if event_start.tzinfo else event_start
-            target_naive = target_dt.replace(tzinfo=None) if target_dt.tzinfo else target_dt
-            if event_start_naive >= target_naive:
-                target_widget = widget
-                break
-        
-        # If no event at or after target, use the last event
-        if target_widget is None and self._event_widgets:
-            target_widget = self._event_widgets[-1]
+        # Find the first event at or after target_dt (widgets follow the index order);
+        # if there is none among the widgets created so far, use the last event
+        pos = self._event_index.first_index_at_or_after(target_dt)
+        target_widget = self._event_widgets[min(pos, len(self._event_widgets) - 1)]
         
         if target_widget:
             # Store the target datetime instead of widget reference (widget may be deleted)
@@ -1787,19 +2142,15 @@ class ListView(QWidget):
             # Scroll so the target widget is at the top
             # Defer to ensure layout is complete
             def _scroll_to_widget():
-                # Re-find the widget by event datetime (guards against widget deletion)
-                for widget in self._event_widgets:
-                    try:
-                        event_start = to_local_datetime(widget.event_data.start)
-                        event_start_naive = event_start.replace(tzinfo=None) if event_start.tzinfo else event_start
-                        target_naive = target_event_start.replace(tzinfo=None) if target_event_start.tzinfo else target_event_start
-                        if event_start_naive >= target_naive:
-                            widget_pos = widget.mapTo(self._content, widget.rect().topLeft())
-                            self._scroll.verticalScrollBar().setValue(max(0, widget_pos.y() - 8))
-                            return
-                    except RuntimeError:
-                        # Widget was deleted, skip it
-                        continue
+                # Re-find the widget by event datetime - the list may have been rebuilt meanwhile
+                pos = self._event_index.first_index_at_or_after(target_event_start)
+                if pos >= len(self._event_widgets):
+                    return
+                widget = self._event_widgets[pos]
+                try:
+                    self._scroll.verticalScrollBar().setValue(max(0, widget.y() - 8))
+                except RuntimeError:
+                    pass  # Widget was deleted
             QTimer.singleShot(50, _scroll_to_widget)
     
     def get_date_range(self) -> tuple[datetime, datetime]:
@@ -1833,23 +2184,10 @@ class ListView(QWidget):
         if not self._event_widgets:
             return
         
-        # Get current local time for comparison
-        now = datetime.now()
-        
-        # Find the first event that starts after now
-        target_widget = None
-        for widget in self._event_widgets:
-            # Compare in local time (to_local_datetime converts UTC events to local)
-            event_start = to_local_datetime(widget.event_data.start)
-            # Remove timezone info for comparison if present
-            event_start_naive = event_start.replace(tzinfo=None) if event_start.tzinfo else event_start
-            if event_start_naive >= now:
-                target_widget = widget
-                break
-        
-        # If no future event, scroll to the last event (it's already past)
-        if target_widget is None and self._event_widgets:
-            target_widget = self._event_widgets[-1]
+        # Find the first event that starts after now (local time, widgets follow the index order);
+        # if there is no future event, scroll to the last event (it's already past)
+        pos = self._event_index.first_index_at_or_after(datetime.now())
+        target_widget = self._event_widgets[min(pos, len(self._event_widgets) - 1)]
         
         if target_widget:
             # Use ensureWidgetVisible to scroll the target into view at the top
@@ -1862,7 +2200,7 @@ class ListView(QWidget):
     
     def refresh_styles(self):
         """Refresh styles after config change (rebuild widgets)."""
-        self._refresh_display()
+        self._refresh_display(reuse_widgets=False)
 
 
 class CalendarWidget(QWidget):
@@ -1881,12 +2219,13 @@ class CalendarWidget(QWidget):
         super().__init__(parent)
         self._current_view = ViewType.WEEK
         self._current_date = date.today()
-        self._cached_events: list[EventData] = []
-        # Stale flags - views need refresh when switched to
-        self._day_view_stale = True
-        self._week_view_stale = True
-        self._month_view_stale = True
-        self._list_view_stale = True
+        self._event_index: Optional[EventIndex] = None
+        # set_events() builds the index in the background; the epoch identifies the latest request
+        self._events_epoch = 0
+        self._event_index_pending = False
+        self._events_fingerprint: Optional[tuple] = None  # Of the latest set_events() list
+        # Stale views need a refresh when switched to
+        self._stale_views: set[ViewType] = set(ViewType)
         self._setup_ui()
     
     def _setup_ui(self):
@@ -1897,35 +2236,52 @@ class CalendarWidget(QWidget):
         
         self._day_view = DayView()
         self._week_view = WeekView()
-        self._month_view = MonthView()
+        self._month_view: Optional[MonthView] = None  # Built on first use, see _ensure_month_view()
         self._list_view = ListView()
         
         for view in [self._day_view, self._week_view]:
-            view.slot_clicked.connect(self.slot_clicked.emit)
-            view.slot_double_clicked.connect(self.slot_double_clicked.emit)
-            view.event_clicked.connect(self.event_clicked.emit)
-            view.event_double_clicked.connect(self.event_double_clicked.emit)
-            view.event_time_changed.connect(self.event_time_changed.emit)
-        
-        self._month_view.day_clicked.connect(lambda d: self.slot_clicked.emit(datetime.combine(d, dt_time(hour=9))))
-        self._month_view.day_double_clicked.connect(lambda d: self.slot_double_clicked.emit(datetime.combine(d, dt_time(hour=9))))
-        self._month_view.event_clicked.connect(self.event_clicked.emit)
-        self._month_view.event_double_clicked.connect(self.event_double_clicked.emit)
-        self._month_view.event_time_changed.connect(self.event_time_changed.emit)
+            view.slot_clicked.connect(self.slot_clicked)
+            view.slot_double_clicked.connect(self.slot_double_clicked)
+            view.event_clicked.connect(self.event_clicked)
+            view.event_double_clicked.connect(self.event_double_clicked)
+            view.event_time_changed.connect(self.event_time_changed)
         
         # List view only emits event clicks (no slot clicks - new events via toolbar)
-        self._list_view.event_clicked.connect(self.event_clicked.emit)
-        self._list_view.event_double_clicked.connect(self.event_double_clicked.emit)
-        self._list_view.visible_range_changed.connect(self.visible_range_changed.emit)
-        
-        self._stack.addWidget(self._day_view)
-        self._stack.addWidget(self._week_view)
-        self._stack.addWidget(self._month_view)
-        self._stack.addWidget(self._list_view)
+        self._list_view.event_clicked.connect(self.event_clicked)
+        self._list_view.event_double_clicked.connect(self.event_double_clicked)
+        self._list_view.visible_range_changed.connect(self.visible_range_changed)
+        
+        self._views = {
+            ViewType.DAY: self._day_view,
+            ViewType.WEEK: self._week_view,
+            ViewType.LIST: self._list_view,
+        }
+        for view in self._views.values():
+            self._stack.addWidget(view)
         
         layout.addWidget(self._stack)
         self.set_view(self._current_view)
     
+    def _ensure_month_view(self) -> MonthView:
+        """Create the month view (42 cells) the first time it is needed."""
+        if self._month_view is None:
+            self._month_view = MonthView()
+            self._month_view.day_clicked.connect(self._on_month_day_clicked)
+            self._month_view.day_double_clicked.connect(self._on_month_day_double_clicked)
+            self._month_view.event_clicked.connect(self.event_clicked)
+            self._month_view.event_double_clicked.connect(self.event_double_clicked)
+            self._month_view.event_time_changed.connect(self.event_time_changed)
+            self._views[ViewType.MONTH] = self._month_view
+            self._stack.addWidget(self._month_view)
+        return self._month_view
+    
+    def _on_month_day_clicked(self, d: date):
+        """A month day click selects 9:00 of that day."""
+        self.slot_clicked.emit(datetime.combine(d, dt_time(hour=9)))
+    
+    def _on_month_day_double_clicked(self, d: date):
+        self.slot_double_clicked.emit(datetime.combine(d, dt_time(hour=9)))
+    
     def set_view(self, view_type: ViewType):
         # Capture reference datetime from the old view before switching
         old_view = self._current_view
@@ -1937,41 +2293,27 @@ class CalendarWidget(QWidget):
         if ref_datetime:
             self._current_date = ref_datetime.date()
         
-        if view_type == ViewType.DAY:
-            self._stack.setCurrentWidget(self._day_view)
-            self._day_view.set_date(self._current_date)
-            # Lazy load: refresh if stale
-            if self._day_view_stale and self._cached_events:
-                self._day_view.set_events(self._cached_events)
-                self._day_view_stale = False
-        elif view_type == ViewType.WEEK:
-            self._stack.setCurrentWidget(self._week_view)
-            self._week_view.set_date(self._current_date)
-            # Lazy load: refresh if stale
-            if self._week_view_stale and self._cached_events:
-                self._week_view.set_events(self._cached_events)
-                self._week_view_stale = False
-        elif view_type == ViewType.MONTH:
-            self._stack.setCurrentWidget(self._month_view)
-            self._month_view.set_date(self._current_date)
-            # Lazy load: refresh if stale
-            if self._month_view_stale and self._cached_events:
-                self._month_view.set_events(self._cached_events)
-                self._month_view_stale = False
-        else:  # LIST
-            self._stack.setCurrentWidget(self._list_view)
-            self._list_view.set_date(self._current_date)
+        if view_type == ViewType.MONTH:
+            self._ensure_month_view()
+        view = self._views[view_type]
+        self._raise_view(view)
+        view.set_date(self._current_date)
+        if view_type == ViewType.LIST and old_view != ViewType.LIST and ref_datetime:
             # For list view switching to it: set pending scroll target
             # It will be applied after events are loaded in _refresh_display()
-            if old_view != ViewType.LIST and ref_datetime:
-                self._list_view._pending_scroll_datetime = ref_datetime
-            # Lazy load: refresh if stale
-            if self._list_view_stale and self._cached_events:
-                self._list_view.set_events(self._cached_events)
-                self._list_view_stale = False
+            self._list_view._pending_scroll_datetime = ref_datetime
+        # Lazy load: refresh if stale
+        if view_type in self._stale_views and self._event_index is not None:
+            view.set_event_index(self._event_index)
+            self._stale_views.discard(view_type)
         
         self.view_changed.emit(view_type)
     
+    def _raise_view(self, view: QWidget):
+        """Make view the visible page of the stack, skipping the switch if it already is."""
+        if self._stack.currentWidget() is not view:
+            self._stack.setCurrentWidget(view)
+    
     def get_reference_datetime(self) -> datetime:
         """Get reference datetime for current view (for view-agnostic state persistence).
         
@@ -2003,41 +2345,46 @@ class CalendarWidget(QWidget):
     
     def set_date(self, d: date):
         self._current_date = d
-        self._day_view.set_date(d)
-        self._week_view.set_date(d)
-        self._month_view.set_date(d)
-        self._list_view.set_date(d)
+        # Only the visible view follows now - set_view() passes the date on when switching
+        # Suspend painting while it updates, re-enabling schedules a single repaint
+        self._stack.setUpdatesEnabled(False)
+        try:
+            self._views[self._current_view].set_date(d)
+        finally:
+            self._stack.setUpdatesEnabled(True)
         self.date_changed.emit(d)
     
     def set_events(self, events: list[EventData]):
-        """Set events - only updates the active view, others are marked stale."""
-        self._cached_events = events
+        """Set events - the index is built in the background, see _on_event_index_ready()."""
+        fingerprint = _events_fingerprint(events)
+        if fingerprint == self._events_fingerprint:
+            return  # Unchanged since the last call (e.g. a sync without changes)
+        self._events_fingerprint = fingerprint
+        self._events_epoch += 1
+        self._event_index_pending = True
+        builder = EventIndexBuilder(events, event_times(events), self._events_epoch)
+        builder.signals.finished.connect(self._on_event_index_ready)
+        QThreadPool.globalInstance().start(builder)
+    
+    def _on_event_index_ready(self, epoch: int, index: Optional[EventIndex]):
+        """Apply a freshly built index - only updates the active view, others are marked stale."""
+        if epoch != self._events_epoch:
+            return  # Superseded by a newer set_events() call
+        self._event_index_pending = False
+        if index is None:
+            # Building failed: keep showing the previous index, and let the next
+            # set_events() call retry even with the same events
+            self._events_fingerprint = None
+            return
+        self._event_index = index
         
         # Only update the currently active view, mark others as stale
-        if self._current_view == ViewType.DAY:
-            self._day_view.set_events(events)
-            self._day_view_stale = False  # Just got fresh events
-            self._week_view_stale = True
-            self._month_view_stale = True
-            self._list_view_stale = True
-        elif self._current_view == ViewType.WEEK:
-            self._week_view.set_events(events)
-            self._week_view_stale = False  # Just got fresh events
-            self._day_view_stale = True
-            self._month_view_stale = True
-            self._list_view_stale = True
-        elif self._current_view == ViewType.MONTH:
-            self._month_view.set_events(events)
-            self._month_view_stale = False  # Just got fresh events
-            self._day_view_stale = True
-            self._week_view_stale = True
-            self._list_view_stale = True
-        else:  # LIST
-            self._list_view.set_events(events)
-            self._list_view_stale = False  # Just got fresh events
-            self._day_view_stale = True
-            self._week_view_stale = True
-            self._month_view_stale = True
+        self._stack.setUpdatesEnabled(False)
+        try:
+            self._views[self._current_view].set_event_index(index)
+        finally:
+            self._stack.setUpdatesEnabled(True)
+        self._stale_views = set(ViewType) - {self._current_view}
     
     def get_current_view(self) -> ViewType:
         return self._current_view
@@ -2046,14 +2393,7 @@ class CalendarWidget(QWidget):
         return self._current_date
     
     def get_date_range(self) -> tuple[datetime, datetime]:
-        if self._current_view == ViewType.DAY:
-            return self._day_view.get_date_range()
-        elif self._current_view == ViewType.WEEK:
-            return self._week_view.get_date_range()
-        elif self._current_view == ViewType.MONTH:
-            return self._month_view.get_date_range()
-        else:  # LIST
-            return self._list_view.get_date_range()
+        return self._views[self._current_view].get_date_range()
     
     def get_list_visible_range(self) -> tuple[Optional[datetime], Optional[datetime]]:
         """Get the visible date range for list view."""
@@ -2065,6 +2405,11 @@ class CalendarWidget(QWidget):
     
     def scroll_list_to_datetime(self, target_dt: datetime):
         """Scroll list view to position events at or after target_dt at top."""
+        if self._event_index_pending:
+            # The list is about to be rebuilt - scroll once the new events are displayed
+            self._list_view._last_scroll_datetime = target_dt
+            self._list_view._pending_scroll_datetime = target_dt
+            return
         self._list_view.scroll_to_datetime(target_dt)
     
     def go_today(self):
@@ -2072,33 +2417,21 @@ class CalendarWidget(QWidget):
             # For list view: scroll to next upcoming event
             self._list_view.scroll_to_upcoming()
         else:
-            self.set_date(date.today())
+            self.set_date(_today_for_minute(QDateTime.currentSecsSinceEpoch() // 60))
     
     def go_previous(self):
-        if self._current_view == ViewType.DAY:
-            self.set_date(self._current_date - timedelta(days=1))
-        elif self._current_view == ViewType.WEEK:
-            self.set_date(self._current_date - timedelta(weeks=1))
-        elif self._current_view == ViewType.MONTH:
-            if self._current_date.month == 1:
-                self.set_date(self._current_date.replace(year=self._current_date.year - 1, month=12))
-            else:
-                self.set_date(self._current_date.replace(month=self._current_date.month - 1))
-        else:  # LIST - scroll up by one page
+        if self._current_view == ViewType.LIST:
+            # List view scrolls up by one page instead of changing the date
             self._list_view.scroll_page_backward()
+        else:
+            self.set_date(self._views[self._current_view].step_backward(self._current_date))
     
     def go_next(self):
-        if self._current_view == ViewType.DAY:
-            self.set_date(self._current_date + timedelta(days=1))
-        elif self._current_view == ViewType.WEEK:
-            self.set_date(self._current_date + timedelta(weeks=1))
-        elif self._current_view == ViewType.MONTH:
-            if self._current_date.month == 12:
-                self.set_date(self._current_date.replace(year=self._current_date.year + 1, month=1))
-            else:
-                self.set_date(self._current_date.replace(month=self._current_date.month + 1))
-        else:  # LIST - scroll down by one page
+        if self._current_view == ViewType.LIST:
+            # List view scrolls down by one page instead of changing the date
             self._list_view.scroll_page_forward()
+        else:
+            self.set_date(self._views[self._current_view].step_forward(self._current_date))
     
     def get_scroll_position(self) -> int:
         """Get scroll position for day/week/list views."""
@@ -2112,12 +2445,19 @@ class CalendarWidget(QWidget):
     
     def set_scroll_position(self, position: int):
         """Set scroll position for day/week/list views."""
+        # Day/week scrollbars stay connected - they keep the time labels in sync
         self._day_view.set_scroll_position(position)
         self._week_view.set_scroll_position(position)
-        self._list_view.set_scroll_position(position)
+        if self._current_view == ViewType.LIST:
+            self._list_view.set_scroll_position(position)
+        else:
+            # A hidden list view must not recompute and report its visible range
+            with QSignalBlocker(self._list_view._scroll.verticalScrollBar()):
+                self._list_view.set_scroll_position(position)
     
     def refresh_styles(self):
         """Refresh styles after config change."""
         self._week_view.refresh_styles()
-        self._month_view.refresh_styles()
+        if self._month_view is not None:
+            self._month_view.refresh_styles()
         self._list_view.refresh_styles()
@@ -7,6 +7,8 @@ Supports drag-and-drop for moving events and resize handles for changing duratio
 
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
+from typing import Optional
 
 from PySide6.QtWidgets import (
     QWidget, QLabel, QVBoxLayout, QHBoxLayout,
@@ -52,19 +54,27 @@ def get_text_font() -> QFont:
 from backend.timezone_utils import to_local_datetime
 
 
-def get_contrasting_text_color(bg_color: str) -> str:
-    """Calculate whether black or white text contrasts better with the background."""
-    # Parse hex color
-    color = bg_color.lstrip('#')
+def _parse_hex_color(hex_color: str) -> Optional[tuple[int, int, int]]:
+    """Parse "#rgb" or "#rrggbb" into (r, g, b) with a single int() call, None if malformed."""
+    color = hex_color.lstrip('#')
     if len(color) == 3:
-        color = ''.join([c*2 for c in color])
-    
+        color = color[0] * 2 + color[1] * 2 + color[2] * 2
+    if len(color) < 6:
+        return None
     try:
-        r = int(color[0:2], 16)
-        g = int(color[2:4], 16)
-        b = int(color[4:6], 16)
-    except (ValueError, IndexError):
+        value = int(color[:6], 16)
+    except ValueError:
+        return None
+    return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
+
+
+@lru_cache(maxsize=256)
+def get_contrasting_text_color(bg_color: str) -> str:
+    """Calculate whether black or white text contrasts better with the background."""
+    rgb = _parse_hex_color(bg_color)
+    if rgb is None:
         return "#000000"
+    r, g, b = rgb
     
     # Calculate luminance
     luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
@@ -72,18 +82,13 @@ def get_contrasting_text_color(bg_color: str) -> str:
     return "#000000" if luminance > 0.5 else "#ffffff"
 
 
+@lru_cache(maxsize=256)
 def lighten_color(hex_color: str, factor: float = 0.3) -> str:
     """Lighten a hex color by the given factor."""
-    color = hex_color.lstrip('#')
-    if len(color) == 3:
-        color = ''.join([c*2 for c in color])
-    
-    try:
-        r = int(color[0:2], 16)
-        g = int(color[2:4], 16)
-        b = int(color[4:6], 16)
-    except (ValueError, IndexError):
+    rgb = _parse_hex_color(hex_color)
+    if rgb is None:
         return hex_color
+    r, g, b = rgb
     
     r = int(min(255, r + (255 - r) * factor))
     g = int(min(255, g + (255 - g) * factor))
@@ -92,6 +97,58 @@ def lighten_color(hex_color: str, factor: float = 0.3) -> str:
     return f"#{r:02x}{g:02x}{b:02x}"
 
 
+@lru_cache(maxsize=64)
+def _event_style(bg_color: str) -> str:
+    """Stylesheet for an EventWidget of the given calendar color."""
+    text_color = get_contrasting_text_color(bg_color)
+    border_color = bg_color
+
+    # Lighten background slightly for better readability
+    bg_lighter = lighten_color(bg_color, 0.4)
+    
+    return f"""
+        EventWidget {{
+            background-color: {bg_lighter};
+            border: 2px solid {border_color};
+            border-left: 4px solid {border_color};
+            border-radius: 4px;
+            color: {text_color};
+        }}
+        EventWidget:hover {{
+            background-color: {lighten_color(bg_color, 0.2)};
+        }}
+        QLabel {{
+            color: {text_color};
+            background: transparent;
+            border: none;
+            padding: 0px;
+            margin: 0px;
+        }}
+    """
+
+
+@lru_cache(maxsize=64)
+def _all_day_event_style(bg_color: str) -> str:
+    """Stylesheet for an AllDayEventWidget of the given calendar color."""
+    text_color = get_contrasting_text_color(bg_color)
+    
+    return f"""
+        AllDayEventWidget {{
+            background-color: {bg_color};
+            border-radius: 3px;
+            color: {text_color};
+            padding: 2px 6px;
+        }}
+        AllDayEventWidget:hover {{
+            background-color: {lighten_color(bg_color, -0.1)};
+        }}
+        QLabel {{
+            color: {text_color};
+            background: transparent;
+        }}
+    """
+
+
 class EventWidget(QFrame):
     """
     Widget representing a single event in the calendar view.
@@ -206,27 +263,40 @@ class EventWidget(QFrame):
         # Get the text font for events
         text_font = get_text_font()
         
-        # Title - convert line breaks to spaces
+        # Title - text is filled in by _update_compact_ui()
         # Indicators (recurring, read-only) are rendered as corner triangles in paintEvent
-        title_text = self._sanitize_text(self.event_data.summary)
-        
-        title_label = QLabel(title_text)
-        title_label.setWordWrap(False)  # Single line, no wrapping
-        title_label.setTextFormat(Qt.PlainText)
+        self._title_label = QLabel()
+        self._title_label.setWordWrap(False)  # Single line, no wrapping
+        self._title_label.setTextFormat(Qt.PlainText)
         # Apply text font with bold
         title_font = QFont(text_font)
         title_font.setBold(True)
-        title_label.setFont(title_font)
-        layout.addWidget(title_label)
+        self._title_label.setFont(title_font)
+        layout.addWidget(self._title_label)
+        
+        # Location label is created on demand
+        self._location_label: Optional[QLabel] = None
+        self._update_compact_ui()
+    
+    def _update_compact_ui(self) -> None:
+        """Fill the compact layout's labels from the current event."""
+        # Title - convert line breaks to spaces
+        self._title_label.setText(self._sanitize_text(self.event_data.summary))
         
         # Location (if present and show_location is True)
         if self.show_location and self.event_data.location:
             location_text = self._sanitize_text(self.event_data.location)
-            location_label = QLabel(location_text)
-            location_label.setWordWrap(False)  # Single line, no wrapping
-            location_label.setTextFormat(Qt.PlainText)
-            location_label.setFont(text_font)
-            layout.addWidget(location_label)
+            if self._location_label is None:
+                self._location_label = QLabel(location_text)
+                self._location_label.setWordWrap(False)  # Single line, no wrapping
+                self._location_label.setTextFormat(Qt.PlainText)
+                self._location_label.setFont(get_text_font())
+                self.layout().addWidget(self._location_label)
+            else:
+                self._location_label.setText(location_text)
+                self._location_label.show()
+        elif self._location_label is not None:
+            self._location_label.hide()
     
     def _setup_full_ui(self) -> None:
         """Set up a full multi-line layout."""
@@ -282,15 +352,29 @@ class EventWidget(QFrame):
         cal_label.setStyleSheet("color: rgba(0, 0, 0, 0.6);")
         layout.addWidget(cal_label)
     
+    def set_event(self, event_data: EventData) -> None:
+        """
+        Show a different event in this widget.
+        
+        Lets views reuse widgets across refreshes instead of constructing new ones.
+        """
+        self.event_data = event_data
+        if self.compact:
+            self._update_compact_ui()
+        else:
+            # The full layout depends on which fields the event has - rebuild it
+            for child in self.findChildren(QWidget, options=Qt.FindDirectChildrenOnly):
+                child.hide()
+                child.deleteLater()
+            QWidget().setLayout(self.layout())  # Reparent the old layout so it gets deleted
+            self._setup_full_ui()
+        self._setup_tooltip()
+        self._apply_style()
+        self.updateGeometry()
+        self.update()
+    
     def _apply_style(self) -> None:
         """Apply color styling based on the event's calendar color."""
-        bg_color = self.event_data.calendar_color
-        text_color = get_contrasting_text_color(bg_color)
-        border_color = bg_color
-
-        # Lighten background slightly for better readability
-        bg_lighter = lighten_color(bg_color, 0.4)
-        
         # Check if event is pending delete (moribund)
         # For EventInstance, pending_operation is on the underlying event
         pending_op = getattr(self.event_data, 'pending_operation', None)
@@ -298,25 +382,10 @@ class EventWidget(QFrame):
             pending_op = getattr(self.event_data.event, 'pending_operation', None)
         is_pending_delete = pending_op == "delete"
 
-        self.setStyleSheet(f"""
-            EventWidget {{
-                background-color: {bg_lighter};
-                border: 2px solid {border_color};
-                border-left: 4px solid {border_color};
-                border-radius: 4px;
-                color: {text_color};
-            }}
-            EventWidget:hover {{
-                background-color: {lighten_color(bg_color, 0.2)};
-            }}
-            QLabel {{
-                color: {text_color};
-                background: transparent;
-                border: none;
-                padding: 0px;
-                margin: 0px;
-            }}
-        """)
+        # Pooled widgets are often rebound to an event of the same calendar - skip the re-polish
+        style = _event_style(self.event_data.calendar_color)
+        if self.styleSheet() != style:
+            self.setStyleSheet(style)
         
         # Apply opacity effect for pending delete (moribund events)
         if is_pending_delete:
@@ -477,6 +546,15 @@ class DraggableEventWidget(EventWidget):
         # Enable mouse tracking for cursor changes
         self.setMouseTracking(True)
     
+    def set_event(self, event_data: EventData) -> None:
+        """Show a different event, dropping any unfinished press/drag state."""
+        self._drag_mode = DragMode.NONE
+        self._press_pos = None
+        self._press_global_pos = None
+        self._is_dragging = False
+        self.setCursor(Qt.PointingHandCursor)
+        super().set_event(event_data)
+    
     def _get_drag_mode_at_pos(self, pos: QPoint) -> DragMode:
         """Determine what drag mode should be used based on mouse position."""
         # Read-only events cannot be dragged
@@ -592,21 +670,6 @@ class AllDayEventWidget(EventWidget):
     
     def _apply_style(self) -> None:
         """Apply styling for all-day events."""
-        bg_color = self.event_data.calendar_color
-        text_color = get_contrasting_text_color(bg_color)
-        
-        self.setStyleSheet(f"""
-            AllDayEventWidget {{
-                background-color: {bg_color};
-                border-radius: 3px;
-                color: {text_color};
-                padding: 2px 6px;
-            }}
-            AllDayEventWidget:hover {{
-                background-color: {lighten_color(bg_color, -0.1)};
-            }}
-            QLabel {{
-                color: {text_color};
-                background: transparent;
-            }}
-        """)
+        style = _all_day_event_style(self.event_data.calendar_color)
+        if self.styleSheet() != style:
+            self.setStyleSheet(style)
@@ -0,0 +1,3 @@
+"""
+Kubux Calendar tests
+"""
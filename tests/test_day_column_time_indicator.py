@@ -0,0 +1,40 @@
+"""Tests for the current-time indicator of DayColumnWidget."""
+
+import os
+import unittest
+from datetime import date, timedelta
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from gui.widgets import calendar_widget
+from gui.widgets.calendar_widget import DayColumnWidget
+
+
+class TimeIndicatorRolloverTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._app = QApplication.instance() or QApplication([])
+
+    def test_indicator_moves_to_the_next_day_at_midnight(self):
+        today = date.today()
+        columns = [DayColumnWidget(today + timedelta(days=offset)) for offset in range(-3, 4)]
+        self.assertEqual([not c._time_indicator.isHidden() for c in columns],
+                         [False, False, False, True, False, False, False])
+
+        class Tomorrow(date):
+            @classmethod
+            def today(cls):
+                return today + timedelta(days=1)
+
+        with mock.patch.object(calendar_widget, "date", Tomorrow):
+            DayColumnWidget._time_timer.timeout.emit()
+
+        self.assertEqual([not c._time_indicator.isHidden() for c in columns],
+                         [False, False, False, False, True, False, False])
+
+
+if __name__ == "__main__":
+    unittest.main()